@@ -0,0 +1,6 @@
+"""
+Throughput and memory benchmarks of gym_cellular_automata.
+
+Every case runs on a fresh process, so its peak RSS is its own.
+Results are written as JSON, see `python -m benchmarks --help`.
+"""
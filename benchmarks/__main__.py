@@ -0,0 +1,154 @@
+"""
+Runs the benchmark cases and writes their results as JSON.
+
+    python -m benchmarks --suites operator --sizes 256 1024 --engines stencil sparse
+    python -m benchmarks --suites env --batches 1 16 --dtypes uint8 int64 -o vector.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks import cases
+
+DEFAULT_MIN_TIME = 0.5
+DEFAULT_OUTPUT = "benchmarks.json"
+
+
+def metadata(args) -> dict:
+    from gym_cellular_automata.version import VERSION
+
+    return {
+        "version": VERSION,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "min_time": args.min_time,
+        "isolated": not args.in_process,
+    }
+
+
+def run_isolated(case: dict, min_time: float) -> dict:
+    """Runs a case on a fresh process, so its peak RSS is its own."""
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(cases.run, case, min_time).result()
+
+
+def summary(result: dict) -> str:
+    params = ", ".join(
+        f"{key}={result[key]}"
+        for key in ("engine", "size", "dtype", "batch")
+        if result.get(key) is not None
+    )
+    rates = ", ".join(
+        f"{key}={result[key]:.4g}" for key in result if key.endswith("_per_sec")
+    )
+
+    return (
+        f"{result['name']} [{params}] {rates}, peak_rss_mb={result['peak_rss_mb']:.1f}"
+    )
+
+
+parser = argparse.ArgumentParser(prog="python -m benchmarks")
+parser.description = "Throughput and memory benchmarks of the envs and operators."
+
+parser.add_argument(
+    "--suites",
+    nargs="+",
+    choices=("env", "operator"),
+    default=["env", "operator"],
+)
+parser.add_argument("--envs", nargs="+", default=list(cases.ENVS))
+parser.add_argument(
+    "--operators", nargs="+", choices=cases.OPERATORS, default=list(cases.OPERATORS)
+)
+parser.add_argument(
+    "--sizes",
+    nargs="+",
+    type=int,
+    default=list(cases.SIZES),
+    help=f"Grid sides of the operator cases. {list(cases.SIZES)}",
+)
+parser.add_argument(
+    "--engines",
+    nargs="+",
+    default=None,
+    help="Only these CA engines, all by default",
+)
+parser.add_argument("--dtypes", nargs="+", default=["uint8"])
+parser.add_argument(
+    "--batches",
+    nargs="+",
+    type=int,
+    default=[1],
+    help="Number of grids per call, vector envs on the env cases. [1]",
+)
+parser.add_argument(
+    "--min-time",
+    type=float,
+    default=DEFAULT_MIN_TIME,
+    help=f"Seconds measured per rate. {DEFAULT_MIN_TIME}",
+)
+parser.add_argument(
+    "--output",
+    "-o",
+    default=DEFAULT_OUTPUT,
+    help=f"JSON file of the results, '-' for stdout. {DEFAULT_OUTPUT}",
+)
+parser.add_argument(
+    "--in-process",
+    action="store_true",
+    help="Runs all the cases on this process, peak RSS is then shared",
+)
+parser.add_argument("--list", action="store_true", help="Lists the cases and exits")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    selection = list(
+        cases.generate(
+            args.suites,
+            args.envs,
+            args.operators,
+            args.sizes,
+            args.dtypes,
+            args.batches,
+            args.engines,
+        )
+    )
+
+    if args.list:
+        for case in selection:
+            print(json.dumps(case))
+        sys.exit()
+
+    results = []
+
+    for i, case in enumerate(selection, start=1):
+        if args.in_process:
+            result = cases.run(case, args.min_time)
+        else:
+            result = run_isolated(case, args.min_time)
+
+        results.append(result)
+        print(f"[{i}/{len(selection)}] {summary(result)}", file=sys.stderr)
+
+    report = json.dumps({"meta": metadata(args), "results": results}, indent=4)
+
+    if args.output == "-":
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
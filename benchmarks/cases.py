@@ -0,0 +1,295 @@
+"""
+Benchmark cases, a case is a dict of JSON values.
+
+    env        steps/sec and resets/sec of a registered env,
+               `batch` > 1 uses its vector env
+    operator   calls/sec of an operator fed back its output grids,
+               restarted from a fixed grid every `RESTART_EVERY` calls,
+               `batch` > 1 passes a batch of grids
+"""
+import itertools
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.measure import peak_rss_mb, rate
+
+ENVS = ("ForestFireHelicopter5x5-v1", "ForestFireBulldozer256x256-v3")
+OPERATORS = ("ForestFire", "WindyForestFire", "Move", "Modify", "RepeatCA")
+
+SIZES = (16, 64, 256, 1024, 4096)
+
+ACTIONS = 1024  # Pool of actions cycled through by the env cases
+
+# Calls before the CA runs on a warm up, e.g. on frozen env steps
+MAX_WARM_UP = 1024
+
+# Operator calls between restarts from the initial grid, before fires burn out
+RESTART_EVERY = 32
+
+# Reference engines, only run up to these grid sizes
+MAX_SIZE = {"loop": 256}
+
+# Operators and engines that take a batch of grids
+BATCHED = {
+    ("ForestFire", "vectorized"),
+    ("ForestFire", "packed"),
+    ("WindyForestFire", "stencil"),
+    ("WindyForestFire", "packed"),
+}
+
+# ForestFireBulldozerEnv defaults
+WIND = np.array(
+    [
+        [0.48, 0.64, 0.98],
+        [0.12, 0.00, 0.64],
+        [0.06, 0.12, 0.48],
+    ]
+)
+
+
+def engines(kind: str, name: str) -> tuple:
+    """Engines of an env or an operator, (None,) if it has no choice of engine."""
+    from gym_cellular_automata.forest_fire import operators
+
+    if kind == "env":
+        if name.startswith("ForestFireHelicopter"):
+            return operators.ForestFire.dense_engines
+        return operators.WindyForestFire.dense_engines
+
+    if name == "RepeatCA":
+        return operators.WindyForestFire.engines
+
+    return getattr(getattr(operators, name), "engines", (None,))
+
+
+def generate(
+    suites: Sequence[str],
+    envs: Sequence[str] = ENVS,
+    operators: Sequence[str] = OPERATORS,
+    sizes: Sequence[int] = SIZES,
+    dtypes: Sequence[str] = ("uint8",),
+    batches: Sequence[int] = (1,),
+    only_engines: Optional[Sequence[str]] = None,
+) -> Iterator[dict]:
+    def selected(kind, name):
+        return [
+            engine
+            for engine in engines(kind, name)
+            if engine is None or only_engines is None or engine in only_engines
+        ]
+
+    if "env" in suites:
+        for env_id, dtype, batch in itertools.product(envs, dtypes, batches):
+            # Vector envs have a fixed batched engine
+            for engine in selected("env", env_id) if batch == 1 else [None]:
+                yield {
+                    "suite": "env",
+                    "name": env_id,
+                    "engine": engine,
+                    "dtype": dtype,
+                    "batch": batch,
+                }
+
+    if "operator" in suites:
+        for name, size, dtype, batch in itertools.product(
+            operators, sizes, dtypes, batches
+        ):
+            for engine in selected("operator", name):
+                if size > MAX_SIZE.get(engine, size):
+                    continue
+
+                if batch > 1 and (name, engine) not in BATCHED:
+                    continue
+
+                yield {
+                    "suite": "operator",
+                    "name": name,
+                    "engine": engine,
+                    "size": size,
+                    "dtype": dtype,
+                    "batch": batch,
+                }
+
+
+def run(case: dict, min_time: float) -> dict:
+    """Measures a case, returns the case updated with its metrics."""
+    rss_start = peak_rss_mb()
+
+    if case["suite"] == "env":
+        metrics = _run_env(min_time, **case)
+    else:
+        metrics = _run_operator(min_time, **case)
+
+    return {
+        **case,
+        **metrics,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_start_mb": rss_start,
+    }
+
+
+def _run_env(min_time, name, engine, dtype, batch, **case):
+    import gymnasium as gym
+
+    import gym_cellular_automata  # noqa: F401, registers the envs
+
+    kwargs = {"dtype": np.dtype(dtype).type}
+
+    if engine is not None:
+        kwargs["ca_engine"] = engine
+
+    if batch == 1:
+        env = gym.make(name, disable_env_checker=True, **kwargs)
+    else:
+        env = gym.make_vec(
+            name, num_envs=batch, vectorization_mode="vector_entry_point", **kwargs
+        )
+
+    env.action_space.seed(0)
+    actions = itertools.cycle([env.action_space.sample() for __ in range(ACTIONS)])
+
+    env.reset(seed=0)
+
+    def step():
+        obs, reward, terminated, truncated, info = env.step(next(actions))
+
+        # Vector envs reset on their own
+        if batch == 1 and (terminated or truncated):
+            env.reset()
+
+    unwrapped = env.unwrapped
+    _warm_up(step, unwrapped.MDP if batch == 1 else unwrapped.ca)
+
+    steps = rate(step, min_time)
+    resets = rate(env.reset, min_time)
+
+    return {
+        "steps_per_sec": steps["per_sec"] * batch,
+        "resets_per_sec": resets["per_sec"] * batch,
+        "calls": steps["calls"] + resets["calls"],
+        "seconds": steps["seconds"] + resets["seconds"],
+    }
+
+
+def _run_operator(min_time, name, engine, size, dtype, batch, **case):
+    operator, initial, action, context = _make_operator(
+        name, engine, size, dtype, batch
+    )
+
+    # Shared by the restarts, operators copy read-only grids before writing
+    if isinstance(initial, np.ndarray):
+        initial.flags.writeable = False
+
+    grid = initial
+    counter = itertools.count()
+
+    def call():
+        # Outputs are fed back as on a rollout, e.g. for the sparse engine front
+        nonlocal grid
+
+        if next(counter) % RESTART_EVERY == 0:
+            grid = initial
+
+        grid, __ = operator(grid, action, context)
+
+    _warm_up(call, operator)
+
+    calls = rate(call, min_time)
+
+    return {
+        "calls_per_sec": calls["per_sec"],
+        "cells_per_sec": calls["per_sec"] * initial.size,
+        "calls": calls["calls"],
+        "seconds": calls["seconds"],
+    }
+
+
+def _warm_up(function, operator):
+    """
+    Calls `function` until the CA of `operator` runs, if any,
+    so that the imports of its engine, e.g. scipy, are not timed.
+    """
+    from gym_cellular_automata.operator import (
+        get_operators,
+        start_timing,
+        stop_timing,
+    )
+
+    # Operators with a choice of engine are CAs
+    ca = next(
+        (op for op in get_operators(operator) if hasattr(op, "engines")), operator
+    )
+
+    timing = next(iter(start_timing(ca).values()))
+
+    try:
+        for __ in range(MAX_WARM_UP):
+            function()
+
+            if timing["calls"] > 0:
+                break
+
+    finally:
+        stop_timing(ca)
+
+    if timing["calls"] == 0:
+        raise RuntimeError(
+            f"{type(ca).__name__} did not run on {MAX_WARM_UP} warm up calls."
+        )
+
+
+def _make_operator(name, engine, size, dtype, batch):
+    from gym_cellular_automata.forest_fire import operators
+    from gym_cellular_automata.forest_fire.utils.packed_grid import PackedGrid
+    from gym_cellular_automata.grid_space import GridSpace
+
+    shape = (size, size)
+    position = np.array([size // 2, size // 2])
+
+    def sample(values, probs):
+        space = GridSpace(values=values, shape=shape, probs=probs, dtype=dtype)
+        space.seed(0)
+        grid = space.sample() if batch == 1 else space.sample_batch(batch)
+
+        # Grids stay packed between updates, values are (empty, tree, fire)
+        return PackedGrid.pack(grid, *values) if engine == "packed" else grid
+
+    def batched(context):
+        return context if batch == 1 else np.repeat(context[None], batch, axis=0)
+
+    if name == "ForestFire":
+        operator = operators.ForestFire(0, 1, 2, engine=engine)
+        grid = sample([0, 1, 2], [0.30, 0.65, 0.05])
+
+        # A batch of contexts is (p_fires, p_trees)
+        return operator, grid, None, batched(np.array([0.033, 0.333])).T
+
+    if name in ("WindyForestFire", "RepeatCA"):
+        operator = operators.WindyForestFire(0, 3, 25, engine=engine)
+        grid = sample([0, 3, 25], [0.10, 0.89, 0.01])
+
+        if name == "WindyForestFire":
+            return operator, grid, None, batched(WIND)
+
+        # A single CA update per call,
+        # the time is a float as it is accumulated in place
+        repeat = operators.RepeatCA(operator, lambda a: 1.0, lambda s: 0.0)
+        return repeat, grid, None, (WIND, 0.0)
+
+    if name == "Move":
+        directions = {
+            "up": {0, 1, 2},
+            "down": {6, 7, 8},
+            "left": {0, 3, 6},
+            "right": {2, 5, 8},
+            "not_move": {4},
+        }
+        operator = operators.Move(directions)
+        return operator, sample([0, 3, 25], None), 2, position
+
+    if name == "Modify":
+        operator = operators.Modify({3: 0})
+        return operator, sample([0, 3, 25], None), True, position
+
+    raise ValueError(f"Unknown operator '{name}', expected one of {OPERATORS}.")
@@ -0,0 +1,38 @@
+import resource
+import sys
+import time
+from typing import Callable
+
+MEGABYTE = 2**20
+
+
+def rate(function: Callable, min_time: float, min_calls: int = 3) -> dict:
+    """
+    Calls `function` until `min_time` seconds and `min_calls` calls are reached,
+    after a warm up call. Dependencies loaded on later calls must be warmed up before.
+    """
+    function()
+
+    calls = 0
+    start = time.perf_counter()
+
+    while True:
+        function()
+        calls += 1
+
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time and calls >= min_calls:
+            break
+
+    return {"calls": calls, "seconds": elapsed, "per_sec": calls / elapsed}
+
+
+def peak_rss_mb() -> float:
+    """High-water mark of the resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Kilobytes on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+
+    return peak * scale / MEGABYTE
@@ -20,6 +20,9 @@ import gym_cellular_automata as gymca
 env_id = gymca.envs[0]
 env = gym.make(env_id, render_mode="human")
 
+# any grid size
+env = gymca.make("ForestFireBulldozer1024x1024-v3")
+
 # prototype mode
 ProtoEnv = gymca.prototypes[0]
 env = ProtoEnv(nrows=42, ncols=42)
@@ -30,10 +33,18 @@ See https://github.com/elbecerrasoto/gym-cellular-automata for documentation.
 from gymnasium.error import Error as GymError
 
 from gym_cellular_automata.ca_env import CAEnv
+from gym_cellular_automata.ca_vector_env import CAVectorEnv
 from gym_cellular_automata.grid_space import GridSpace
 from gym_cellular_automata.operator import Operator
+from gym_cellular_automata.recorder import TrajectoryRecorder
+from gym_cellular_automata.trajectory import TrajectoryReader, TrajectoryWriter
 from gym_cellular_automata.registration import GYM_MAKE as envs
-from gym_cellular_automata.registration import _register_caenvs, prototypes
+from gym_cellular_automata.registration import (
+    _register_caenvs,
+    make,
+    make_vec,
+    register_grid,
+)
 from gym_cellular_automata.version import VERSION as __version__
 
 # Exports for user code
@@ -47,4 +58,27 @@ except GymError:
     pass
 
 
-__all__ = ["envs", "prototypes", "CAEnv", "GridSpace", "Operator"]
+def __getattr__(name):
+    # Env classes are imported on first access
+    if name == "prototypes":
+        from gym_cellular_automata import registration
+
+        return registration.prototypes
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "envs",
+    "prototypes",
+    "make",
+    "make_vec",
+    "register_grid",
+    "CAEnv",
+    "CAVectorEnv",
+    "GridSpace",
+    "Operator",
+    "TrajectoryRecorder",
+    "TrajectoryReader",
+    "TrajectoryWriter",
+]
@@ -9,3 +9,7 @@ PROJECT_PATH = Path(__file__).parents[1]
 # Delegation of explicit typing as much as possible
 # For floats using the spaces Box default
 TYPE_BOX = np.float32
+
+# Forest fire cell values fit on a byte,
+# a compact grid cuts observation memory and bandwidth
+TYPE_GRID = np.uint8
@@ -1,10 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import Counter
+from copy import deepcopy
+from typing import Any, NamedTuple, Optional, Union
 
 import gymnasium as gym
+import numpy as np
 from gymnasium import logger
 from gymnasium.utils import seeding
 
+from gym_cellular_automata.operator import (
+    Timed,
+    get_operators,
+    new_timing,
+    start_timing,
+    stop_timing,
+)
+from gym_cellular_automata.tiled_grid import TiledGrid
+
+
+class CAState(NamedTuple):
+    """Snapshot of a CAEnv, see `CAEnv.get_state`."""
+
+    grid: Union[np.ndarray, TiledGrid]
+    context: Any
+    done: bool
+    steps_elapsed: int
+    reward_accumulated: float
+    steps_beyond_done: int
+    counts: np.ndarray
+    rng_states: list
+
 
 class CAEnv(ABC, gym.Env):
     @property
@@ -17,20 +42,36 @@ class CAEnv(ABC, gym.Env):
     def initial_state(self):
         self._resample_initial = False
 
-    def __init__(self, nrows, ncols, debug=False, **kwargs):
+    # Grids sampled on reset, if any, seeded along with the operators on reset(seed)
+    initial_grid_space: Optional[gym.Space] = None
+
+    def __new__(cls, *args, **kwargs):
+        # Constructor arguments, for `clone`
+        env = super().__new__(cls)
+        env._init_args = args, kwargs
+        return env
+
+    def __init__(self, nrows, ncols, debug=False, render_mode=None, **kwargs):
         self.nrows, self.ncols = nrows, ncols  # nrows & ncols is API
 
+        self.render_mode = render_mode
+        self._renderers = {}  # Built on first render, one per render mode
+
         self._debug = debug
         if self._debug:
             print("Perhaps you forgot to do env.reset()")
 
     def step(self, action):
         if not self.done:
+            grid = self.grid
+
             # MDP Transition
             self.state = self.grid, self.context = self.MDP(
                 self.grid, action, self.context
             )
 
+            self._update_counts(grid)
+
             # Check for termination
             self._is_done()
 
@@ -64,6 +105,9 @@ class CAEnv(ABC, gym.Env):
     def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
         super().reset(seed=seed)
 
+        if seed is not None:
+            self._seed_components(seed)
+
         self.done = False
         self.steps_elapsed = 0
         self.reward_accumulated = 0.0
@@ -71,14 +115,158 @@ class CAEnv(ABC, gym.Env):
         self._resample_initial = True
         obs = self.state = self.grid, self.context = self.initial_state
 
+        self._recount()
+
         return obs, self._report()
 
+    def clone(self) -> "CAEnv":
+        """A new env of the same constructor arguments, e.g. to simulate aside."""
+        args, kwargs = self._init_args
+        return type(self)(*args, **kwargs)
+
+    def _seed_components(self, seed: int):
+        """
+        Seeds the operators and the initial grids from the seed of `reset`,
+        so the seed and the actions alone reproduce an episode.
+        """
+        operators = list({id(op): op for op in get_operators(self.MDP)}.values())
+        *sequences, grid_sequence = np.random.SeedSequence(seed).spawn(
+            len(operators) + 1
+        )
+
+        for op, sequence in zip(operators, sequences):
+            op.np_random = np.random.Generator(np.random.PCG64(sequence))
+
+        if self.initial_grid_space is not None:
+            self.initial_grid_space.seed(int(grid_sequence.generate_state(1)[0]))
+
+    def get_state(self, base: Optional[CAState] = None) -> CAState:
+        """
+        Snapshot of the grid, context, termination, step counters
+        and the RNG states of the env and its operators.
+        Cheaper than a deepcopy of the env, e.g. for tree search.
+
+        Snapshot grids are read-only and shared until written.
+        Given the `base` snapshot the env was branched from,
+        the grid is stored as a `TiledGrid`, only copying its changed tiles.
+        """
+        if self.grid is not self._counted_grid:
+            self._recount()
+
+        if not self.grid.flags.writeable:
+            grid = self.grid  # Not written since restored
+
+        elif base is not None:
+            grid = TiledGrid(self.grid, base=base.grid)
+
+        else:
+            grid = self.grid.copy()
+            grid.flags.writeable = False
+
+        return CAState(
+            grid,
+            deepcopy(self.context),
+            self.done,
+            self.steps_elapsed,
+            self.reward_accumulated,
+            self.steps_beyond_done,
+            self._counts.copy(),
+            self.get_rng_states(),
+        )
+
+    def set_state(self, state: CAState):
+        """
+        Restores a snapshot from `get_state`, the snapshot can be reused.
+        Dense grids are shared, the operators copy read-only grids on write.
+        """
+        if isinstance(state.grid, TiledGrid):
+            self.grid = state.grid.to_array()
+        else:
+            self.grid = state.grid
+
+        self.context = deepcopy(state.context)
+        self.state = self.grid, self.context
+
+        self.done = state.done
+        self.steps_elapsed = state.steps_elapsed
+        self.reward_accumulated = state.reward_accumulated
+        self.steps_beyond_done = state.steps_beyond_done
+
+        self._counts = state.counts.copy()
+        self._counted_grid = self.grid
+
+        self.set_rng_states(state.rng_states)
+
+    def get_rng_states(self) -> list:
+        """RNG states of the env, of its initial grids and of its operators."""
+        space = self.initial_grid_space
+        space_state = None if space is None else space.np_random.bit_generator.state
+
+        return [self.np_random.bit_generator.state, space_state] + [
+            op.get_rng_state() for op in get_operators(self.MDP)
+        ]
+
+    def set_rng_states(self, states: list):
+        env_state, space_state, *op_states = states
+        self.np_random.bit_generator.state = env_state
+
+        if space_state is not None:
+            self.initial_grid_space.np_random.bit_generator.state = space_state
+
+        for op, state in zip(get_operators(self.MDP), op_states):
+            op.set_rng_state(state)
+
     def status(self):
-        return {
+        status = {
             "steps_elapsed": self.steps_elapsed,
             "reward_accumulated": self.reward_accumulated,
         }
 
+        if self._timings is not None:
+            status["timings"] = self.get_timings()
+
+        return status
+
+    # Per operator timings, see `enable_timing`
+    _timings = None
+
+    def enable_timing(self, info: bool = False):
+        """
+        Times `step`, `_award` and every operator of the MDP,
+        as calls, total and last wall times in seconds.
+
+        Timings are reported by `status`, and by the info of `step` if `info`.
+        Disabled timing has no overhead.
+        """
+        self.disable_timing()
+
+        self._timings = {"step": new_timing(), "_award": new_timing()}
+        self._timings.update(start_timing(self.MDP))
+
+        # Timed methods are set on the instance
+        self.step = Timed(type(self).step.__get__(self), self._timings["step"])
+        self._award = Timed(type(self)._award.__get__(self), self._timings["_award"])
+
+        if info:
+            self._report = self._timed_report
+
+    def disable_timing(self):
+        if self._timings is None:
+            return
+
+        stop_timing(self.MDP)
+
+        for name in ("step", "_award", "_report"):
+            self.__dict__.pop(name, None)
+
+        self._timings = None
+
+    def get_timings(self) -> dict:
+        return {path: dict(timing) for path, timing in self._timings.items()}
+
+    def _timed_report(self):
+        return {**type(self)._report(self), "timings": self.get_timings()}
+
     @abstractmethod
     def _award(self):
         raise NotImplementedError
@@ -93,7 +281,45 @@ class CAEnv(ABC, gym.Env):
 
     def count_cells(self, grid=None):
         """Returns dict of cell counts"""
-        from collections import Counter
-
         grid = self.grid if grid is None else grid
-        return Counter(grid.flatten().tolist())
+
+        if grid is self._counted_grid:
+            counts = self._counts
+        else:
+            counts = self._bincount(grid)
+
+        return Counter(dict(zip(self.grid_space.values.tolist(), counts.tolist())))
+
+    # Cell counts per value of `grid_space`,
+    # they are kept up to date with the diffs reported by the MDP.
+    # In-place writes to `grid` from outside the MDP are not tracked.
+    _counted_grid = None
+
+    def _update_counts(self, previous_grid):
+        diff = self.MDP.diff
+
+        if diff is None or previous_grid is not self._counted_grid:
+            self._recount()
+            return
+
+        __, old, new = diff
+        value_indices = self.grid_space.value_indices
+        old, new = value_indices(old), value_indices(new)
+
+        if np.any(old < 0) or np.any(new < 0):
+            self._recount()
+            return
+
+        np.subtract.at(self._counts, old, 1)
+        np.add.at(self._counts, new, 1)
+
+        self._counted_grid = self.grid
+
+    def _recount(self):
+        self._counts = self._bincount(self.grid)
+        self._counted_grid = self.grid
+
+    def _bincount(self, grid):
+        # Foreign cells, at index -1, are dropped on bin 0
+        indices = self.grid_space.value_indices(grid).ravel() + 1
+        return np.bincount(indices, minlength=self.grid_space.n + 1)[1:]
@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from gymnasium.utils import seeding
+from gymnasium.vector import AutoresetMode, VectorEnv
+
+
+class CAVectorEnv(ABC, VectorEnv):
+    """
+    Base class for N copies of a CAEnv stepped as a single batch.
+
+    Parameters and single spaces are taken from a prototype CAEnv.
+    Sub-environments are reset on the step after they terminate.
+    """
+
+    metadata = {"render_modes": [], "autoreset_mode": AutoresetMode.NEXT_STEP}
+
+    def __init__(self, prototype, num_envs: int, copy: bool = True):
+        self.prototype = prototype
+        self.num_envs = num_envs
+        self.copy = copy
+
+        self.nrows, self.ncols = prototype.nrows, prototype.ncols
+
+        self.single_observation_space = prototype.observation_space
+        self.single_action_space = prototype.action_space
+
+        # Per sub-environment initial values, e.g. positions, use their own generator
+        self._env_np_randoms = [seeding.np_random()[0] for __ in range(num_envs)]
+
+        self._autoreset = np.zeros(num_envs, dtype=bool)
+
+    def reset(
+        self,
+        *,
+        seed: Optional[Union[int, Sequence[int]]] = None,
+        options: Optional[dict] = None,
+    ):
+        if seed is not None:
+            self._np_random, self._env_np_randoms = self._spawn_np_randoms(seed)
+            self._np_random_seed = seed if isinstance(seed, int) else -1
+
+            self._seed_envs()
+
+        options = {} if options is None else options
+        mask = options.get("reset_mask", np.ones(self.num_envs, dtype=bool))
+
+        self._reset_envs(np.flatnonzero(mask))
+        self._autoreset[mask] = False
+
+        return self._observation(), {}
+
+    def step(self, actions):
+        resetting = self._autoreset.copy()
+        stepping = np.logical_not(resetting)
+
+        self._reset_envs(np.flatnonzero(resetting))
+
+        rewards, terminations, infos = self._step_envs(np.asarray(actions), stepping)
+
+        rewards = np.where(stepping, rewards, 0.0)
+        terminations = stepping & terminations
+        truncations = np.zeros(self.num_envs, dtype=bool)
+
+        self._autoreset = terminations
+
+        return self._observation(), rewards, terminations, truncations, infos
+
+    def _spawn_np_randoms(self, seed):
+        """
+        Independent generators, the shared one and one per sub-environment.
+        An int seed is spawned, a sequence of seeds seeds each sub-environment.
+        """
+        if isinstance(seed, int):
+            shared, *sequences = np.random.SeedSequence(seed).spawn(self.num_envs + 1)
+
+        else:
+            seeds = list(seed)
+            assert len(seeds) == self.num_envs, "A seed per environment is needed."
+
+            shared = np.random.SeedSequence(seeds).spawn(1)[0]
+            sequences = [np.random.SeedSequence(s) for s in seeds]
+
+        def generator(sequence):
+            return np.random.Generator(np.random.PCG64(sequence))
+
+        return generator(shared), [generator(sequence) for sequence in sequences]
+
+    def _seed_envs(self):
+        """Hook called after reseeding, e.g. to forget sticky initial values."""
+        pass
+
+    @abstractmethod
+    def _reset_envs(self, indices):
+        """Sets the initial state of the sub-environments at `indices`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _step_envs(self, actions, stepping):
+        """
+        Steps the sub-environments where `stepping` is True.
+
+        Returns batched rewards, terminations and infos.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _get_state(self):
+        """Returns the batched (grids, context) without copying."""
+        raise NotImplementedError
+
+    def _observation(self):
+        grids, context = self._get_state()
+
+        if self.copy:
+            return grids.copy(), tuple(np.copy(c) for c in context)
+
+        return grids, context
@@ -3,7 +3,7 @@ from typing import Optional, Tuple
 import numpy as np
 from gymnasium import spaces
 
-from gym_cellular_automata._config import TYPE_BOX
+from gym_cellular_automata._config import TYPE_BOX, TYPE_GRID
 from gym_cellular_automata.ca_env import CAEnv
 from gym_cellular_automata.forest_fire.operators import (
     Modify,
@@ -12,14 +12,15 @@ from gym_cellular_automata.forest_fire.operators import (
     RepeatCA,
     WindyForestFire,
 )
+from gym_cellular_automata.forest_fire.utils.render import RGBRenderer
 from gym_cellular_automata.grid_space import GridSpace
-from gym_cellular_automata.operator import Operator
+from gym_cellular_automata.operator import Operator, chain_diffs
 
-from .utils.render import render
+from .utils.render import COLOR_EMPTY, COLOR_FIRE, COLOR_TREE, BulldozerRenderer
 
 
 class ForestFireBulldozerEnv(CAEnv):
-    metadata = {"render_modes": ["human"]}
+    metadata = {"render_modes": ["human", "rgb_array"]}
 
     @property
     def MDP(self):
@@ -60,10 +61,19 @@ class ForestFireBulldozerEnv(CAEnv):
             "down": 0.12,
             "down_right": 0.48,
         },
-        **kwargs
+        ca_engine="sparse",
+        ca_per_cell=False,
+        dtype=TYPE_GRID,
+        **kwargs,
     ):
         super().__init__(nrows, ncols, **kwargs)
 
+        if ca_engine not in WindyForestFire.dense_engines:
+            raise ValueError(
+                f"Unknown engine '{ca_engine}', expected one of "
+                f"{WindyForestFire.dense_engines}, the env grids are not packed."
+            )
+
         self.title = "ForestFireBulldozer" + str(nrows) + "x" + str(ncols)
 
         # Env Representation Parameters
@@ -88,6 +98,8 @@ class ForestFireBulldozerEnv(CAEnv):
         self._tree = 3  # Tree cell
         self._fire = 25  # Fire cell
 
+        self._dtype = dtype  # Cell type of the grid
+
         # Initial Condition Parameters
 
         self._pos_bull = (
@@ -95,6 +107,10 @@ class ForestFireBulldozerEnv(CAEnv):
         )
         self._pos_fire = pos_fire  # Initial position of fire, default at `initial_fire`
 
+        # Positions given by the user, others are sampled again on reset(seed)
+        self._fixed_pos_bull = pos_bull
+        self._fixed_pos_fire = pos_fire
+
         self._p_tree = p_tree  # Initial Tree probability
         self._p_empty = p_empty  # Initial Empty probality
 
@@ -159,7 +175,14 @@ class ForestFireBulldozerEnv(CAEnv):
         self._set_spaces()
         self._init_time_mappings()
 
-        self.ca = WindyForestFire(self._empty, self._tree, self._fire, **self.ca_space)
+        self.ca = WindyForestFire(
+            self._empty,
+            self._tree,
+            self._fire,
+            engine=ca_engine,
+            per_cell=ca_per_cell,
+            **self.ca_space,
+        )
 
         self.move = Move(self._action_sets, **self.move_space)
         self.modify = Modify(self._effects, **self.modify_space)
@@ -174,8 +197,25 @@ class ForestFireBulldozerEnv(CAEnv):
     # Gym API
     # step, reset & seed methods inherited from parent class
 
-    def render(self, mode="human"):
-        return render(self)
+    def render(self, mode=None):
+        mode = mode or self.render_mode or "human"
+
+        # Built on first render, later renders only update the frame
+        if mode not in self._renderers:
+            self._renderers[mode] = self._get_renderer(mode)
+
+        return self._renderers[mode].render()
+
+    def _get_renderer(self, mode):
+        if mode == "rgb_array":
+            colors = {
+                self._empty: COLOR_EMPTY,
+                self._tree: COLOR_TREE,
+                self._fire: COLOR_FIRE,
+            }
+            return RGBRenderer(self, colors)
+
+        return BulldozerRenderer(self)
 
     def _award(self):
         """Reward Function
@@ -213,11 +253,18 @@ class ForestFireBulldozerEnv(CAEnv):
         return -(f / (t + f))
 
     def _is_done(self):
-        self.done = not bool(np.any(self.grid == self._fire))
+        self.done = self.count_cells()[self._fire] == 0
 
     def _report(self):
         return {"hit": self.modify.hit}
 
+    def _seed_components(self, seed):
+        super()._seed_components(seed)
+
+        # Sampled positions are kept between resets, unless reseeded
+        self._pos_bull = self._fixed_pos_bull
+        self._pos_fire = self._fixed_pos_fire
+
     def _noise(self, ax_len):
         """
         Noise to initial conditions.
@@ -226,20 +273,12 @@ class ForestFireBulldozerEnv(CAEnv):
         upper = int(ax_len * AX_PERCENT)
 
         if upper > 0:
-            return int(self.np_random.choice(range(upper), size=1))
+            return int(self.np_random.choice(range(upper), size=1)[0])
         else:
             return 0
 
     def _initial_grid_distribution(self):
-        # fmt: off
-        grid_space = GridSpace(
-            values = [  self._empty,   self._tree,   self._fire],
-            probs  = [self._p_empty, self._p_tree,          0.0],
-            shape=(self.nrows, self.ncols),
-        )
-        # fmt: on
-
-        grid = grid_space.sample()
+        grid = self.initial_grid_space.sample()
 
         # Fire Position
         # Around the lower left quadrant
@@ -315,8 +354,19 @@ class ForestFireBulldozerEnv(CAEnv):
         self.grid_space = GridSpace(
             values=[self._empty, self._tree, self._fire],
             shape=(self.nrows, self.ncols),
+            dtype=self._dtype,
         )
 
+        # Built once, sampled on every reset
+        # fmt: off
+        self.initial_grid_space = GridSpace(
+            values = [  self._empty,   self._tree,   self._fire],
+            probs  = [self._p_empty, self._p_tree,          0.0],
+            shape=(self.nrows, self.ncols),
+            dtype=self._dtype,
+        )
+        # fmt: on
+
         self.ca_params_space = spaces.Box(0.0, 1.0, shape=(3, 3))
         self.position_space = spaces.MultiDiscrete([self.nrows, self.ncols])
         self.time_space = spaces.Box(0.0, float("inf"), shape=tuple())
@@ -392,4 +442,9 @@ class MDP(Operator):
         grid, (ca_params, time) = self.repeat_ca(grid, action, (ca_params, time))
         grid, position = self.move_modify(grid, action, position)
 
+        # Cells modified in place on the CA output, for its front
+        self.repeat_ca.ca.track_diff(grid, self.move_modify.diff)
+
+        self.diff = chain_diffs(self.repeat_ca.diff, self.move_modify.diff)
+
         return grid, (ca_params, position, time)
@@ -50,3 +50,168 @@ def test_starting_conditions_seed(env):
 
     # Single fire seed
     assert len(grid[grid == env._fire]) == 1
+
+
+def test_incremental_counts(env):
+    import numpy as np
+
+    env.reset()
+
+    for step in range(THRESHOLD * 16):
+        obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+        grid, context = obs
+
+        values, counts = np.unique(grid, return_counts=True)
+        observed = env.count_cells()
+
+        assert all(observed[v] == c for v, c in zip(values.tolist(), counts))
+
+        if terminated:
+            break
+
+
+def test_packed_engine_is_operator_only():
+    with pytest.raises(ValueError):
+        ForestFireBulldozerEnv(nrows=NROWS, ncols=NCOLS, ca_engine="packed")
+
+
+def test_sparse_engine_matches_stencil():
+    import numpy as np
+
+    rollouts = []
+
+    for engine in ("stencil", "sparse"):
+        env = ForestFireBulldozerEnv(nrows=64, ncols=64, ca_engine=engine)
+        env.action_space.seed(0)
+
+        obs, info = env.reset(seed=0)
+        grids = [obs[0]]
+
+        for step in range(4 * THRESHOLD):
+            obs, reward, terminated, truncated, info = env.step(
+                env.action_space.sample()
+            )
+            grids.append(obs[0])
+
+            if terminated:
+                break
+
+        rollouts.append(grids)
+
+    stencil, sparse = rollouts
+    assert len(stencil) == len(sparse)
+    assert all(np.array_equal(a, b) for a, b in zip(stencil, sparse))
+
+
+def test_grid_dtype_is_kept(env):
+    import numpy as np
+
+    obs, info = env.reset()
+    assert obs[0].dtype == np.uint8
+
+    for step in range(THRESHOLD):
+        obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+        assert obs[0].dtype == np.uint8
+
+
+def test_get_set_state(env):
+    import numpy as np
+
+    env.reset(seed=3)
+    actions = [env.action_space.sample() for __ in range(THRESHOLD * 4)]
+
+    def rollout():
+        grids = []
+        for action in actions:
+            obs, *__ = env.step(action)
+            grids.append(obs[0].copy())
+        return grids
+
+    state = env.get_state()
+
+    grids1 = rollout()
+    env.set_state(state)
+    grids2 = rollout()
+
+    assert all(np.all(g1 == g2) for g1, g2 in zip(grids1, grids2))
+
+    # The snapshot is not modified by the rollouts
+    env.set_state(state)
+    assert env.steps_elapsed == state.steps_elapsed
+    assert np.all(env.grid == state.grid)
+
+
+def test_branching_shares_grids(env):
+    import numpy as np
+
+    from gym_cellular_automata.tiled_grid import TiledGrid
+
+    env.reset(seed=5)
+    root = env.get_state()
+
+    # Restored grids are shared, the snapshot is copied on write
+    env.set_state(root)
+    assert env.grid is root.grid
+
+    while not env.modify.hit:
+        env.step(env.action_space.sample())
+
+    assert env.grid is not root.grid
+    assert not root.grid.flags.writeable
+
+    env.set_state(root)
+    assert env.get_state().grid is root.grid
+
+    # Children from the root only store their changed tiles
+    while env.grid is root.grid:
+        env.step(env.action_space.sample())
+
+    child = env.get_state(base=root)
+
+    assert isinstance(child.grid, TiledGrid)
+    assert child.grid.nbytes_shared(root.grid) > 0
+
+    actions = [env.action_space.sample() for __ in range(THRESHOLD)]
+
+    def rollout(state):
+        env.set_state(state)
+        return [env.step(action)[0][0].copy() for action in actions]
+
+    grids_child = rollout(child)
+    assert all(np.all(g1 == g2) for g1, g2 in zip(grids_child, rollout(child)))
+
+
+def test_timing(env):
+    from copy import deepcopy
+
+    env.reset(seed=1)
+    assert "timings" not in env.status()
+
+    env.enable_timing(info=True)
+    obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+
+    timings = env.status()["timings"]
+    assert set(timings) == {
+        "step",
+        "_award",
+        "MDP",
+        "MDP/RepeatCA",
+        "MDP/RepeatCA/WindyForestFire",
+        "MDP/MoveModify",
+        "MDP/MoveModify/Move",
+        "MDP/MoveModify/Modify",
+    }
+    assert timings["step"]["calls"] == timings["MDP"]["calls"] == 1
+    assert timings["MDP/MoveModify/Move"]["calls"] == 1
+    assert info["timings"]["MDP"]["calls"] == 1
+
+    # Copies time themselves
+    copied = deepcopy(env)
+    copied.step(env.action_space.sample())
+    assert copied.status()["timings"]["MDP"]["calls"] == 2
+    assert env.status()["timings"]["MDP"]["calls"] == 1
+
+    env.disable_timing()
+    obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+    assert "timings" not in env.status() and "timings" not in info
+    assert "update" not in vars(env.MDP)
@@ -0,0 +1,137 @@
+import gymnasium as gym
+import numpy as np
+import pytest
+
+from gym_cellular_automata.forest_fire.bulldozer import (
+    ForestFireBulldozerEnv,
+    ForestFireBulldozerVectorEnv,
+)
+
+NUM_ENVS = 4
+NROWS, NCOLS = 32, 32
+STEPS = 64
+
+# Fire always propagates, CA updates become deterministic
+CERTAIN_WIND = {
+    direction: 1.0
+    for direction in (
+        "up_left",
+        "up",
+        "up_right",
+        "left",
+        "right",
+        "down_left",
+        "down",
+        "down_right",
+    )
+}
+
+
+@pytest.fixture
+def envs():
+    return ForestFireBulldozerVectorEnv(NUM_ENVS, NROWS, NCOLS)
+
+
+def test_vector_env_spaces(envs):
+    obs, info = envs.reset(seed=0)
+    assert envs.observation_space.contains(obs)
+
+    for step in range(STEPS):
+        obs, rewards, terminations, truncations, infos = envs.step(
+            envs.action_space.sample()
+        )
+
+        assert envs.observation_space.contains(obs)
+        assert rewards.shape == terminations.shape == truncations.shape
+        assert rewards.shape == (NUM_ENVS,)
+        assert infos["hit"].shape == (NUM_ENVS,)
+
+
+def test_vector_env_seed():
+    def rollout(seed):
+        envs = ForestFireBulldozerVectorEnv(NUM_ENVS, NROWS, NCOLS)
+        envs.action_space.seed(seed)
+        obs, info = envs.reset(seed=seed)
+
+        for step in range(STEPS):
+            obs, *__ = envs.step(envs.action_space.sample())
+
+        return obs
+
+    grids1, __ = rollout(42)
+    grids2, __ = rollout(42)
+
+    assert np.all(grids1 == grids2)
+
+
+@pytest.mark.parametrize("seed", [7, [7, 8, 9, 10]])
+def test_vector_env_independent_generators(seed):
+    envs = ForestFireBulldozerVectorEnv(NUM_ENVS, NROWS, NCOLS)
+    envs.reset(seed=seed)
+
+    generators = [envs.np_random, *envs._env_np_randoms]
+    draws = [generator.random(8) for generator in generators]
+
+    assert len({draw.tobytes() for draw in draws}) == len(generators)
+
+
+def test_vector_env_autoreset(envs):
+    envs.reset(seed=0)
+
+    # Extinguish the fire of the first env
+    envs.grids[0][envs.grids[0] == envs._fire] = envs._empty
+
+    not_move_nor_shoot = np.repeat([[4, 0]], NUM_ENVS, axis=0)
+
+    obs, rewards, terminations, truncations, infos = envs.step(not_move_nor_shoot)
+    assert terminations[0]
+
+    obs, rewards, terminations, truncations, infos = envs.step(not_move_nor_shoot)
+    grids, (winds, positions, times) = obs
+
+    assert not terminations[0]
+    assert rewards[0] == 0.0
+    assert times[0] == 0.0
+    assert np.count_nonzero(grids[0] == envs._fire) == 1
+
+
+@pytest.mark.parametrize("per_cell", [False, True])
+def test_vector_env_matches_single_env(per_cell):
+    envs = ForestFireBulldozerVectorEnv(
+        NUM_ENVS, NROWS, NCOLS, wind=CERTAIN_WIND, ca_per_cell=per_cell, copy=False
+    )
+    env = ForestFireBulldozerEnv(NROWS, NCOLS, wind=CERTAIN_WIND, ca_per_cell=per_cell)
+
+    envs.reset(seed=0)
+    env.reset(seed=0)
+
+    # Short of burning the whole forest
+    for step in range(STEPS // 4):
+        actions = envs.action_space.sample()
+
+        # Mirror the state of the first env
+        env.grid = envs.grids[0].copy()
+        env.context = envs.winds[0], envs.positions[0].copy(), envs.times[0].copy()
+
+        obs, reward, terminated, truncated, info = env.step(actions[0])
+        vobs, vrewards, vterminations, vtruncations, vinfos = envs.step(actions)
+
+        grid, (wind, position, time) = obs
+
+        assert np.all(grid == envs.grids[0])
+        assert np.all(position == envs.positions[0])
+        assert np.isclose(time, envs.times[0])
+        assert np.isclose(reward, vrewards[0])
+        assert terminated == vterminations[0]
+        assert info["hit"] == vinfos["hit"][0]
+
+        if terminated:
+            break
+
+
+def test_make_vec():
+    envs = gym.make_vec("ForestFireBulldozer256x256-v3", num_envs=NUM_ENVS)
+    assert isinstance(envs.unwrapped, ForestFireBulldozerVectorEnv)
+
+    obs, info = envs.reset()
+    assert envs.observation_space.contains(obs)
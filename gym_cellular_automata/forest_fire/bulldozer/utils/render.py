@@ -11,17 +11,17 @@ The render of the bulldozer consists of four subplots:
 """
 from warnings import filterwarnings
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from gym_cellular_automata.forest_fire.utils.neighbors import moore_n
 from gym_cellular_automata.forest_fire.utils.render import (
     EMOJIFONT,
     TITLEFONT,
-    align_marker,
+    Renderer,
     clear_ax,
+    get_font,
     get_norm_cmap,
-    parse_svg_into_mpl,
+    get_svg_marker,
     plot_grid,
 )
 
@@ -63,37 +63,28 @@ filterwarnings("ignore", message="Glyph 108")
 filterwarnings("ignore", message="Glyph 112")
 
 
-def render(env):
-    NROWS = env.nrows
-    NCOLS = env.ncols
+class BulldozerRenderer(Renderer):
+    def build(self):
+        import matplotlib.pyplot as plt
 
-    EMPTY = env._empty
-    TREE = env._tree
-    FIRE = env._fire
+        env = self.env
 
-    # Assumes that cells values are in ascending order and paired with its colors
-    COLORS = [COLOR_EMPTY, COLOR_TREE, COLOR_FIRE]
-    CELLS = [EMPTY, TREE, FIRE]
-    NORM, CMAP = get_norm_cmap(CELLS, COLORS)
+        # Assumes that cells values are in ascending order and paired with its colors
+        COLORS = [COLOR_EMPTY, COLOR_TREE, COLOR_FIRE]
+        CELLS = [env._empty, env._tree, env._fire]
+        self.norm, self.cmap = get_norm_cmap(CELLS, COLORS)
 
-    grid = env.grid
-    ca_params, pos, time = env.context
+        # Why two titles?
+        # The env was registered (benchmark) or
+        # The env was directly created (prototype)
+        TITLE = env.spec.id if env.spec is not None else env.title
 
-    local_grid = moore_n(N_LOCAL, pos, grid, EMPTY)
-    pos_fseed = env._pos_fire
-
-    # Why two titles?
-    # The env was registered (benchmark) or
-    # The env was directly created (prototype)
-    TITLE = env.spec.id if env.spec is not None else env.title
-
-    def main():
         plt.style.use(FIGSTYLE)
         fig_shape = (12, 14)
         fig = plt.figure(figsize=FIGSIZE)
         fig.suptitle(
             TITLE,
-            font=TITLEFONT,
+            font=get_font(TITLEFONT),
             fontsize=TITLE_SIZE,
             **TITLE_POS,
             color="0.6",
@@ -105,60 +96,77 @@ def render(env):
         ax_gauge = plt.subplot2grid(fig_shape, (10, 0), colspan=8, rowspan=2)
         ax_counts = plt.subplot2grid(fig_shape, (6, 8), colspan=6, rowspan=6)
 
-        plot_local(ax_lgrid, local_grid)
+        self.build_local(ax_lgrid)
+        self.build_global(ax_ggrid)
+        self.build_gauge(ax_gauge)
+        self.build_counts(ax_counts)
 
-        plot_global(ax_ggrid, grid, pos, pos_fseed)
+        return fig
 
-        plot_gauge(ax_gauge, time)
+    def update(self):
+        env = self.env
 
-        d = env.count_cells()
-        counts = d[EMPTY], d[TREE], d[FIRE]
-        plot_counts(ax_counts, *counts)
+        grid = env.grid
+        ca_params, pos, time = env.context
 
-        return plt.gcf()
+        self.local_image.set_data(moore_n(N_LOCAL, pos, grid, env._empty))
+        self.global_image.set_data(grid)
 
-    def plot_local(ax, grid):
-        nrows, ncols = grid.shape
-        mid_row, mid_col = nrows // 2, nrows // 2
+        self.fseed_mark.set_data([env._pos_fire[1]], [env._pos_fire[0]])
+        self.location_mark.set_data([pos[1]], [pos[0]])
+
+        self.gauge_bar.set_width(float(time))
+
+        d = env.count_cells()
+        self.update_counts(d[env._empty], d[env._tree], d[env._fire])
 
-        plot_grid(ax, grid, interpolation="none", cmap=CMAP, norm=NORM)
+    def build_local(self, ax):
+        side = 2 * N_LOCAL + 1
+        mid_row, mid_col = side // 2, side // 2
 
-        markbull = parse_svg_into_mpl(svg_paths.BULLDOZER)
+        local_grid = np.full((side, side), self.env._empty)
+        self.local_image = plot_grid(
+            ax, local_grid, interpolation="none", cmap=self.cmap, norm=self.norm
+        )
+
+        markbull = get_svg_marker(svg_paths.BULLDOZER)
         ax.plot(
             mid_col, mid_row, marker=markbull, markersize=MARKBULL_SIZE, color="1.0"
         )
 
-    def plot_global(ax, grid, pos, pos_fseed):
-        ax.imshow(grid, interpolation="none", cmap=CMAP, norm=NORM)
+    def build_global(self, ax):
+        self.global_image = ax.imshow(
+            self.env.grid, interpolation="none", cmap=self.cmap, norm=self.norm
+        )
 
         # Fire Seed
-        markfire = align_marker(parse_svg_into_mpl(svg_paths.FIRE), valign="bottom")
+        markfire = get_svg_marker(svg_paths.FIRE, valign="bottom")
 
-        ax.plot(
-            pos_fseed[1],
-            pos_fseed[0],
+        (self.fseed_mark,) = ax.plot(
+            [],
+            [],
             marker=markfire,
             markersize=MARKFSEED_SIZE,
             color=COLOR_FIRE,
         )
 
         # Bulldozer Location
-        marklocation = align_marker(
-            parse_svg_into_mpl(svg_paths.LOCATION), valign="bottom"
-        )
+        marklocation = get_svg_marker(svg_paths.LOCATION, valign="bottom")
 
-        ax.plot(
-            pos[1],
-            pos[0],
+        (self.location_mark,) = ax.plot(
+            [],
+            [],
             marker=marklocation,
             markersize=MARKLOCATION_SIZE,
             color="1.0",
         )
         clear_ax(ax)
 
-    def plot_gauge(ax, time):
+    def build_gauge(self, ax):
         HEIGHT_GAUGE = 0.1
-        ax.barh(0.0, time, height=HEIGHT_GAUGE, color=COLOR_GAUGE, edgecolor="None")
+        (self.gauge_bar,) = ax.barh(
+            0.0, 0.0, height=HEIGHT_GAUGE, color=COLOR_GAUGE, edgecolor="None"
+        )
 
         ax.barh(
             0.0,
@@ -179,40 +187,30 @@ def render(env):
 
         # Set the CA update symbol
         ax.set_yticks([0])  # Set symbol position
-        ax.set_yticklabels(CYCLE_SYMBOL, font=EMOJIFONT, size=CYCLE_SIZE)
+        ax.set_yticklabels(CYCLE_SYMBOL, font=get_font(EMOJIFONT), size=CYCLE_SIZE)
         ax.get_yticklabels()[0].set_color("0.74")  # Light gray
 
         clear_ax(ax, yticks=False)
 
-    def plot_counts(ax, counts_empty, counts_tree, counts_fire):
-        counts_total = sum((counts_empty, counts_tree, counts_fire))
+    def build_counts(self, ax):
+        # Cell counts always add up to the grid size
+        counts_total = self.env.nrows * self.env.ncols
 
-        commons = {"x": [0, 1], "width": 0.1}
+        commons = {"x": [0, 1], "height": [0, 0], "width": 0.1}
         pc = "1.0"  # placeholder color
 
-        lv1y = [counts_tree, 0]
-        lv1c = [COLOR_TREE, pc]
-
-        lv2y = [0, counts_empty]  # level 2 y axis
-        lv2c = [pc, COLOR_EMPTY]  # level 2 colors
-        lv2b = lv1y  # level 2 bottom
-
-        lv3y = [0, counts_fire]
-        lv3c = [pc, COLOR_FIRE]
-        lv3b = [lv1y[i] + lv2y[i] for i in range(len(lv1y))]
-
-        # First Level Bars
-        ax.bar(height=lv1y, color=lv1c, **commons)
+        # Tree bar on the left, empty and fire bars stacked on the right
+        lv1, __ = ax.bar(color=[COLOR_TREE, pc], **commons)
+        __, lv2 = ax.bar(color=[pc, COLOR_EMPTY], **commons)
+        __, lv3 = ax.bar(color=[pc, COLOR_FIRE], **commons)
 
-        # Second Level Bars
-        ax.bar(height=lv2y, color=lv2c, bottom=lv2b, **commons)
-
-        # Third Level Bars
-        ax.bar(height=lv3y, color=lv3c, bottom=lv3b, **commons)
+        self.count_bars = lv1, lv2, lv3
 
         # Bar Symbols Settings
         ax.set_xticks(np.arange(2))
-        ax.set_xticklabels([TREE_SYMBOL, BURNED_SYMBOL], font=EMOJIFONT, size=34)
+        ax.set_xticklabels(
+            [TREE_SYMBOL, BURNED_SYMBOL], font=get_font(EMOJIFONT), size=34
+        )
         # Same colors as bars
         for label, color in zip(ax.get_xticklabels(), [COLOR_TREE, COLOR_FIRE]):
             label.set_color(color)
@@ -239,4 +237,12 @@ def render(env):
         # Add back y marks each quarter
         ax.grid(axis="y", color="0.94")  # Dim gray
 
-    return main()
+    def update_counts(self, counts_empty, counts_tree, counts_fire):
+        lv1, lv2, lv3 = self.count_bars
+
+        lv1.set_height(counts_tree)
+
+        lv2.set_height(counts_empty)
+
+        lv3.set_y(counts_empty)
+        lv3.set_height(counts_fire)
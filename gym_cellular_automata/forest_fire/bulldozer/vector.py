@@ -0,0 +1,186 @@
+import numpy as np
+from gymnasium.vector.utils import batch_space
+
+from gym_cellular_automata._config import TYPE_BOX
+from gym_cellular_automata.ca_vector_env import CAVectorEnv
+from gym_cellular_automata.forest_fire.operators import WindyForestFire
+from gym_cellular_automata.forest_fire.utils import vector
+from gym_cellular_automata.grid_space import GridSpace
+
+from .bulldozer import ForestFireBulldozerEnv
+
+
+class ForestFireBulldozerVectorEnv(CAVectorEnv):
+    """
+    N Bulldozer environments stepped as a single batch.
+
+    All grids live on one (N, nrows, ncols) array.
+    Each sub-environment keeps its own CA clock,
+    so the CA updates of a step are masked per environment.
+
+        Example::
+
+            >>> gym.make_vec("ForestFireBulldozer256x256-v3", num_envs=16)
+
+    """
+
+    def __init__(self, num_envs: int, nrows: int, ncols: int, copy=True, **kwargs):
+        # Parameters, spaces and timings are those of a single environment
+        proto = ForestFireBulldozerEnv(nrows, ncols, **kwargs)
+        super().__init__(proto, num_envs, copy)
+
+        self._empty, self._tree, self._fire = proto._empty, proto._tree, proto._fire
+
+        self._set_spaces()
+        self._init_lookups()
+
+        # Batches of grids are only supported by the stencil engine
+        self.ca = WindyForestFire(
+            self._empty,
+            self._tree,
+            self._fire,
+            engine="stencil",
+            per_cell=proto.ca.per_cell,
+            **proto.ca_space,
+        )
+
+        # Sticky initial positions, as on the single environment
+        self._pos_fire = np.full((num_envs, 2), -1)
+        self._pos_bull = np.full((num_envs, 2), -1)
+
+        self.grids = np.zeros((num_envs, nrows, ncols), dtype=self._grid_dtype)
+        self.winds = np.repeat(proto._wind[None], num_envs, axis=0)
+        self.positions = np.zeros((num_envs, 2), dtype=np.int64)
+        self.times = np.zeros(num_envs, dtype=TYPE_BOX)
+
+    def _seed_envs(self):
+        # Batched sampling of the CA and of the initial grids
+        self.ca.np_random = self.np_random
+        self.initial_grid_space.seed(int(self.np_random.integers(2**32)))
+
+        self._pos_fire.fill(-1)
+        self._pos_bull.fill(-1)
+
+    def _reset_envs(self, indices):
+        proto = self.prototype
+
+        self.grids[indices] = self.initial_grid_space.sample_batch(len(indices))
+
+        for i in indices:
+            np_random = self._env_np_randoms[i]
+
+            # Around the lower left quadrant
+            if np.any(self._pos_fire[i] < 0):
+                self._pos_fire[i] = self._initial_position(
+                    np_random, (3, 1), proto._fixed_pos_fire
+                )
+
+            # Around the upper right quadrant
+            if np.any(self._pos_bull[i] < 0):
+                self._pos_bull[i] = self._initial_position(
+                    np_random, (1, 3), proto._fixed_pos_bull
+                )
+
+            r, c = self._pos_fire[i]
+            self.grids[i, r, c] = self._fire
+
+        self.winds[indices] = proto._wind
+        self.positions[indices] = self._pos_bull[indices]
+        self.times[indices] = 0.0
+
+    def _step_envs(self, actions, stepping):
+        moves, shoots = actions[:, 0], actions[:, 1]
+
+        self._repeat_ca(moves, shoots, stepping)
+
+        vector.move(
+            self.positions, moves, self._directions, self.grids.shape[1:], stepping
+        )
+
+        shooting = stepping & (shoots == self.prototype._shoots["shoot"])
+        hits = vector.modify(self.grids, self.positions, shooting, *self._substitutions)
+
+        t, f = self._count(self._tree), self._count(self._fire)
+
+        rewards = np.zeros(self.num_envs, dtype=np.float64)
+        np.divide(-f, t + f, out=rewards, where=t + f > 0)
+
+        return rewards, f == 0, {"hit": hits, "_hit": stepping}
+
+    def _get_state(self):
+        return self.grids, (self.winds, self.positions, self.times)
+
+    def _initial_position(self, np_random, quarters, fixed):
+        """
+        Noisy position around the given grid quarters, as on the single env.
+        Positions are kept between resets unless the env is reseeded.
+        """
+        if fixed is not None:
+            return fixed
+
+        def noise(ax_len):
+            AX_PERCENT = 1 / 12
+            upper = int(ax_len * AX_PERCENT)
+
+            return int(np_random.integers(upper)) if upper > 0 else 0
+
+        qr, qc = quarters
+        r = (qr * self.nrows // 4) + noise(self.nrows)
+        c = (qc * self.ncols // 4) + noise(self.ncols)
+
+        return r, c
+
+    def _repeat_ca(self, moves, shoots, stepping):
+        time_taken = (
+            self._time_per_move[moves]
+            + self._time_per_shoot[shoots]
+            + self.prototype._t_env_any
+        )
+
+        accu_time = self.times + np.where(stepping, time_taken, 0.0)
+        repeats = np.floor(accu_time)
+        self.times[:] = accu_time - repeats
+
+        # Each sub-environment runs its own number of CA updates
+        for repeat in range(int(repeats.max(initial=0))):
+            (updating,) = np.nonzero(repeats > repeat)
+
+            self.grids[updating], __ = self.ca(
+                self.grids[updating], None, self.winds[updating]
+            )
+
+    def _count(self, cell):
+        return np.count_nonzero(self.grids == cell, axis=(1, 2))
+
+    def _init_lookups(self):
+        proto = self.prototype
+
+        self._time_per_move = np.zeros(len(proto._moves))
+        for move, time in proto._movement_timings.items():
+            self._time_per_move[move] = time
+
+        self._time_per_shoot = np.zeros(len(proto._shoots))
+        for shoot, time in proto._shooting_timings.items():
+            self._time_per_shoot[shoot] = time
+
+        self._directions = vector.get_directions(proto._action_sets, len(proto._moves))
+
+        ncells = max(self._empty, self._tree, self._fire) + 1
+        self._substitutions = vector.get_effects(
+            proto._effects, ncells, self._grid_dtype
+        )
+
+    def _set_spaces(self):
+        proto, n = self.prototype, self.num_envs
+
+        self._grid_dtype = proto.grid_space.dtype
+
+        self.initial_grid_space = GridSpace(
+            values=proto.initial_grid_space.values,
+            probs=proto.initial_grid_space.probs,
+            shape=(self.nrows, self.ncols),
+            dtype=self._grid_dtype,
+        )
+
+        self.observation_space = batch_space(self.single_observation_space, n)
+        self.action_space = batch_space(self.single_action_space, n)
@@ -1,3 +1,6 @@
 from gym_cellular_automata.forest_fire.helicopter.helicopter import (
     ForestFireHelicopterEnv,
 )
+from gym_cellular_automata.forest_fire.helicopter.vector import (
+    ForestFireHelicopterVectorEnv,
+)
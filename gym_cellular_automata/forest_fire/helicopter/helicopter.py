@@ -3,7 +3,7 @@ from typing import Optional
 import numpy as np
 from gymnasium import logger, spaces
 
-from gym_cellular_automata._config import TYPE_BOX
+from gym_cellular_automata._config import TYPE_BOX, TYPE_GRID
 from gym_cellular_automata.ca_env import CAEnv
 from gym_cellular_automata.forest_fire.operators import (
     ForestFire,
@@ -11,14 +11,15 @@ from gym_cellular_automata.forest_fire.operators import (
     Move,
     MoveModify,
 )
+from gym_cellular_automata.forest_fire.utils.render import RGBRenderer
 from gym_cellular_automata.grid_space import GridSpace
-from gym_cellular_automata.operator import Operator
+from gym_cellular_automata.operator import Operator, chain_diffs
 
-from .utils.render import render
+from .utils.render import COLOR_EMPTY, COLOR_FIRE, COLOR_TREE, HelicopterRenderer
 
 
 class ForestFireHelicopterEnv(CAEnv):
-    metadata = {"render_modes": ["human"]}
+    metadata = {"render_modes": ["human", "rgb_array"]}
 
     @property
     def MDP(self):
@@ -27,7 +28,7 @@ class ForestFireHelicopterEnv(CAEnv):
     @property
     def initial_state(self):
         if self._resample_initial:
-            self.grid = self.grid_space.sample()
+            self.grid = self.initial_grid_space.sample()
 
             ca_params = np.array([self._p_fire, self._p_tree], dtype=TYPE_BOX)
             pos = np.array([self.nrows // 2, self.ncols // 2])
@@ -41,11 +42,24 @@ class ForestFireHelicopterEnv(CAEnv):
         return self._initial_state
 
     def __init__(
-        self, nrows, ncols, speed: float = 0.5, freeze: Optional[int] = None, **kwargs
+        self,
+        nrows,
+        ncols,
+        speed: float = 0.5,
+        freeze: Optional[int] = None,
+        ca_engine="vectorized",
+        dtype=TYPE_GRID,
+        **kwargs,
     ):
         # Sets defaults and runs seed method
         super().__init__(nrows, ncols, **kwargs)
 
+        if ca_engine not in ForestFire.dense_engines:
+            raise ValueError(
+                f"Unknown engine '{ca_engine}', expected one of "
+                f"{ForestFire.dense_engines}, the env grids are not packed."
+            )
+
         self.title = "ForestFireHelicopter" + str(nrows) + "x" + str(ncols)
 
         # Env Representation Parameters
@@ -73,6 +87,8 @@ class ForestFireHelicopterEnv(CAEnv):
         self._tree = 1
         self._fire = 2
 
+        self._dtype = dtype  # Cell type of the grid
+
         # Env Behavior Parameters
 
         self._p_fire = 0.033
@@ -95,7 +111,7 @@ class ForestFireHelicopterEnv(CAEnv):
         self._set_spaces()
 
         self.cellular_automaton = ForestFire(
-            self._empty, self._tree, self._fire, **self.ca_space
+            self._empty, self._tree, self._fire, engine=ca_engine, **self.ca_space
         )
 
         self.move = Move(self._action_sets, **self.move_space)
@@ -114,8 +130,25 @@ class ForestFireHelicopterEnv(CAEnv):
     # Gym API
     # step, reset & seed methods inherited from parent class
 
-    def render(self, mode="human"):
-        return render(self)
+    def render(self, mode=None):
+        mode = mode or self.render_mode or "human"
+
+        # Built on first render, later renders only update the frame
+        if mode not in self._renderers:
+            self._renderers[mode] = self._get_renderer(mode)
+
+        return self._renderers[mode].render()
+
+    def _get_renderer(self, mode):
+        if mode == "rgb_array":
+            colors = {
+                self._empty: COLOR_EMPTY,
+                self._tree: COLOR_TREE,
+                self._fire: COLOR_FIRE,
+            }
+            return RGBRenderer(self, colors)
+
+        return HelicopterRenderer(self)
 
     def _award(self):
         ncells = self.nrows * self.ncols
@@ -152,6 +185,14 @@ class ForestFireHelicopterEnv(CAEnv):
         self.grid_space = GridSpace(
             values=[self._empty, self._tree, self._fire],
             shape=(self.nrows, self.ncols),
+            dtype=self._dtype,
+        )
+
+        # Sampled on every reset, apart from the observations
+        self.initial_grid_space = GridSpace(
+            values=[self._empty, self._tree, self._fire],
+            shape=(self.nrows, self.ncols),
+            dtype=self._dtype,
         )
 
         # RL spaces
@@ -223,11 +264,15 @@ class MDP(Operator):
 
             freeze = np.array(self.max_freeze)
 
+            self.diff = chain_diffs(self.ca.diff, self.move_modify.diff)
+
         else:
             grid, position = self.move_modify(grid, (action, True), position)
 
             freeze = np.array(freeze - 1)
 
+            self.diff = self.move_modify.diff
+
         context = ca_params, position, freeze
 
         return grid, context
@@ -89,6 +89,28 @@ def test_helicopterMDP_is_operator(env):
     assert_operator(env.MDP, strict=True)
 
 
+def test_packed_engine_is_operator_only():
+    with pytest.raises(ValueError):
+        ForestFireHelicopterEnv(nrows=8, ncols=8, ca_engine="packed")
+
+
+def test_observations_are_not_overwritten():
+    # A CA update on each step
+    env = ForestFireHelicopterEnv(nrows=16, ncols=16, freeze=0)
+    env.action_space.seed(0)
+
+    obs, info = env.reset(seed=0)
+    grids, copies = [obs[0]], [obs[0].copy()]
+
+    for step in range(30):
+        obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+        grids.append(obs[0])
+        copies.append(obs[0].copy())
+
+    for grid, copy in zip(grids, copies):
+        assert np.array_equal(grid, copy)
+
+
 def test_forest_fire_env_private_methods(env, reward_space):
     env.reset()
     action = env.action_space.sample()
@@ -180,6 +202,43 @@ def test_env_render(env):
     assert isinstance(env.render(), matplotlib.figure.Figure)
 
 
+def test_env_render_rgb_array():
+    env = ForestFireHelicopterEnv(ROW, COL, render_mode="rgb_array")
+    env.reset()
+
+    frame = env.render()
+    scale = frame.shape[0] // ROW
+
+    assert frame.shape == (ROW * scale, COL * scale, 3)
+    assert frame.dtype == np.uint8
+
+    # Upper left corner of each cell, away from the agent sprite
+    grid = env.grid
+    corners = frame[::scale, ::scale]
+    renderer = env._renderers["rgb_array"]
+
+    __, (row, col), __ = env.context
+    mask = np.ones_like(grid, dtype=bool)
+    mask[row, col] = False
+
+    assert np.all(corners[mask] == renderer.palette[grid][mask])
+
+
+def test_env_render_reuses_figure(env):
+    import matplotlib.pyplot as plt
+
+    env.reset()
+    fig = env.render()
+
+    env.step(env.action_space.sample())
+    assert env.render() is fig
+
+    # Closed figures are rebuilt
+    plt.close("all")
+    assert env.render() is not fig
+    plt.close("all")
+
+
 def manual_assesment(verbose=False):
     from time import sleep
 
@@ -209,3 +268,16 @@ def manual_assesment(verbose=False):
 
         sleep(0.2)
         print(".", end="")
+
+
+def test_incremental_counts(env):
+    env.reset()
+
+    for step in range(RANDOM_POLICY_ITERATIONS * 4):
+        obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+        grid, context = obs
+
+        values, counts = np.unique(grid, return_counts=True)
+        observed = env.count_cells()
+
+        assert all(observed[v] == c for v, c in zip(values.tolist(), counts))
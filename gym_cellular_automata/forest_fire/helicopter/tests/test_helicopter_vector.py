@@ -0,0 +1,106 @@
+import gymnasium as gym
+import numpy as np
+import pytest
+
+from gym_cellular_automata.forest_fire.helicopter import (
+    ForestFireHelicopterEnv,
+    ForestFireHelicopterVectorEnv,
+)
+
+NUM_ENVS = 16
+ROW, COL = 5, 5
+STEPS = 32
+
+
+@pytest.fixture
+def envs():
+    return ForestFireHelicopterVectorEnv(NUM_ENVS, ROW, COL)
+
+
+def test_vector_env_spaces(envs):
+    obs, info = envs.reset(seed=0)
+    assert envs.observation_space.contains(obs)
+
+    for step in range(STEPS):
+        obs, rewards, terminations, truncations, infos = envs.step(
+            envs.action_space.sample()
+        )
+
+        assert envs.observation_space.contains(obs)
+        assert rewards.shape == (NUM_ENVS,)
+        assert not np.any(terminations)
+
+
+def test_vector_env_seed():
+    def rollout(seed):
+        envs = ForestFireHelicopterVectorEnv(NUM_ENVS, ROW, COL)
+        envs.action_space.seed(seed)
+        obs, info = envs.reset(seed=seed)
+
+        for step in range(STEPS):
+            obs, *__ = envs.step(envs.action_space.sample())
+
+        return obs
+
+    grids1, __ = rollout(42)
+    grids2, __ = rollout(42)
+
+    assert np.all(grids1 == grids2)
+
+
+def test_vector_env_matches_single_env():
+    envs = ForestFireHelicopterVectorEnv(NUM_ENVS, ROW, COL, copy=False)
+    env = ForestFireHelicopterEnv(ROW, COL)
+
+    envs.reset(seed=0)
+    env.reset(seed=0)
+
+    # Without lightning nor growth the CA is deterministic
+    envs.ca_params[:] = 0.0
+
+    for step in range(STEPS):
+        actions = envs.action_space.sample()
+
+        # Mirror the state of the first env
+        env.grid = envs.grids[0].copy()
+        env.context = (
+            envs.ca_params[0],
+            envs.positions[0].copy(),
+            envs.freezes[0].copy(),
+        )
+
+        obs, reward, terminated, truncated, info = env.step(actions[0])
+        vobs, vrewards, vterminations, vtruncations, vinfos = envs.step(actions)
+
+        grid, (ca_params, position, freeze) = obs
+
+        assert np.all(grid == envs.grids[0])
+        assert np.all(position == envs.positions[0])
+        assert freeze == envs.freezes[0]
+        assert np.isclose(reward, vrewards[0])
+        assert info["hit"] == vinfos["hit"][0]
+
+
+def test_make_vec():
+    envs = gym.make_vec("ForestFireHelicopter5x5-v1", num_envs=NUM_ENVS)
+    assert isinstance(envs.unwrapped, ForestFireHelicopterVectorEnv)
+
+    obs, info = envs.reset()
+    assert envs.observation_space.contains(obs)
+
+
+def test_async_shared_memory():
+    envs = gym.make_vec(
+        "ForestFireHelicopter5x5-v1",
+        num_envs=2,
+        vectorization_mode="async",
+        vector_kwargs={"shared_memory": True},
+    )
+
+    obs, info = envs.reset(seed=0)
+    obs, *__ = envs.step(envs.action_space.sample())
+
+    assert envs.observation_space.contains(obs)
+    assert obs[0].shape == (2, 5, 5)
+
+    envs.close()
@@ -1,10 +1,9 @@
-import matplotlib.patheffects as path_effects
-import matplotlib.pyplot as plt
-
 from gym_cellular_automata.forest_fire.utils.render import (
     TITLEFONT,
+    Renderer,
+    get_font,
     get_norm_cmap,
-    parse_svg_into_mpl,
+    get_svg_marker,
     plot_grid,
 )
 
@@ -20,53 +19,58 @@ HELICOPTER_SIZE = 96
 HELICOPTER_COLOR = "#FFFFFF"  # White
 
 
-def render(env):
-    grid = env.grid
-    __, pos, __ = env.context
-    row, col = pos
+class HelicopterRenderer(Renderer):
+    def build(self):
+        import matplotlib.patheffects as path_effects
+        import matplotlib.pyplot as plt
+
+        env = self.env
 
-    plt.style.use("seaborn-v0_8-whitegrid")
-    fig, ax = plt.subplots(figsize=(15, 12))
+        plt.style.use("seaborn-v0_8-whitegrid")
+        fig, ax = plt.subplots(figsize=(15, 12))
 
-    NROWS = env.nrows
-    NCOLS = env.ncols
+        # Why two titles?
+        # The env was registered (benchmark) or
+        # The env was directly created (prototype)
+        TITLE = env.spec.id if env.spec is not None else env.title
 
-    # Why two titles?
-    # The env was registered (benchmark) or
-    # The env was directly created (prototype)
-    TITLE = env.spec.id if env.spec is not None else env.title
+        CELLS = [env._empty, env._tree, env._fire]
+        COLORS = [COLOR_EMPTY, COLOR_TREE, COLOR_FIRE]
 
-    EMPTY = env._empty
-    TREE = env._tree
-    FIRE = env._fire
+        # Title
+        fig.suptitle(
+            TITLE,
+            color=TITLE_COLOR,
+            font=get_font(TITLEFONT),
+            fontsize=TITLE_SIZE,
+            ha="center",
+        )
 
-    CELLS = [EMPTY, TREE, FIRE]
-    COLORS = [COLOR_EMPTY, COLOR_TREE, COLOR_FIRE]
+        # Main Plot
+        norm, cmap = get_norm_cmap(CELLS, COLORS)
+        self.image = plot_grid(ax, env.grid, aspect="equal", norm=norm, cmap=cmap)
 
-    # Title
-    fig.suptitle(
-        TITLE,
-        color=TITLE_COLOR,
-        font=TITLEFONT,
-        fontsize=TITLE_SIZE,
-        ha="center",
-    )
+        # Helicopter Mark
+        helicopter_mark = get_svg_marker(SVG_PATH)
+        pe = [
+            path_effects.Stroke(linewidth=3, foreground="white"),
+            path_effects.Normal(),
+        ]
+        (self.helicopter,) = ax.plot(
+            [],
+            [],
+            marker=helicopter_mark,
+            markersize=HELICOPTER_SIZE,
+            color=HELICOPTER_COLOR,
+            fillstyle="none",
+            path_effects=pe,
+        )
 
-    # Main Plot
-    norm, cmap = get_norm_cmap(CELLS, COLORS)
-    plot_grid(ax, grid, aspect="equal", norm=norm, cmap=cmap)
+        return fig
 
-    # Helicopter Mark
-    helicopter_mark = parse_svg_into_mpl(SVG_PATH)
-    pe = [path_effects.Stroke(linewidth=3, foreground="white"), path_effects.Normal()]
-    ax.plot(
-        col,
-        row,
-        marker=helicopter_mark,
-        markersize=HELICOPTER_SIZE,
-        color=HELICOPTER_COLOR,
-        fillstyle="none",
-        path_effects=pe,
-    )
+    def update(self):
+        __, pos, __ = self.env.context
+        row, col = pos
 
-    return fig
+        self.image.set_data(self.env.grid)
+        self.helicopter.set_data([col], [row])
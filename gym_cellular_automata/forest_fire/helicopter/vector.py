@@ -0,0 +1,116 @@
+import numpy as np
+from gymnasium.vector.utils import batch_space
+
+from gym_cellular_automata._config import TYPE_BOX
+from gym_cellular_automata.ca_vector_env import CAVectorEnv
+from gym_cellular_automata.forest_fire.operators import ForestFire
+from gym_cellular_automata.forest_fire.utils import vector
+from gym_cellular_automata.grid_space import GridSpace
+
+from .helicopter import ForestFireHelicopterEnv
+
+
+class ForestFireHelicopterVectorEnv(CAVectorEnv):
+    """
+    N Helicopter environments stepped as a single batch.
+
+    All grids live on one (N, nrows, ncols) array.
+    On each step the CA only runs for the sub-environments
+    whose freeze counter is at zero.
+
+        Example::
+
+            >>> gym.make_vec("ForestFireHelicopter5x5-v1", num_envs=1024)
+
+    """
+
+    def __init__(self, num_envs: int, nrows: int, ncols: int, copy=True, **kwargs):
+        # Parameters and spaces are those of a single environment
+        proto = ForestFireHelicopterEnv(nrows, ncols, **kwargs)
+        super().__init__(proto, num_envs, copy)
+
+        self._empty, self._tree, self._fire = proto._empty, proto._tree, proto._fire
+        self._cells = proto.grid_space.values
+
+        self._set_spaces()
+
+        self.ca = ForestFire(
+            self._empty, self._tree, self._fire, engine="vectorized", **proto.ca_space
+        )
+
+        self._directions = vector.get_directions(proto._action_sets, proto._n_actions)
+        self._substitutions = vector.get_effects(
+            proto._effects, self._cells.max() + 1, self._grid_dtype
+        )
+
+        self._reward_weights = np.array(
+            [proto._reward_per_empty, proto._reward_per_tree, proto._reward_per_fire]
+        )
+
+        self.grids = np.zeros((num_envs, nrows, ncols), dtype=self._grid_dtype)
+        self.ca_params = np.zeros((num_envs, 2), dtype=TYPE_BOX)
+        self.positions = np.zeros((num_envs, 2), dtype=np.int64)
+        self.freezes = np.zeros(num_envs, dtype=np.int64)
+
+    def _seed_envs(self):
+        # Batched sampling of the CA and of the initial grids
+        self.ca.np_random = self.np_random
+        self.initial_grid_space.seed(int(self.np_random.integers(2**32)))
+
+    def _reset_envs(self, indices):
+        proto = self.prototype
+
+        self.grids[indices] = self.initial_grid_space.sample_batch(len(indices))
+
+        self.ca_params[indices] = proto._p_fire, proto._p_tree
+        self.positions[indices] = self.nrows // 2, self.ncols // 2
+        self.freezes[indices] = proto._max_freeze
+
+    def _step_envs(self, actions, stepping):
+        # The CA runs only where the freeze counter is over
+        (updating,) = np.nonzero(stepping & (self.freezes == 0))
+
+        if updating.size > 0:
+            # Context as (p_fire, p_tree), each with a value per env
+            self.grids[updating], __ = self.ca(
+                self.grids[updating], None, self.ca_params[updating].T
+            )
+
+        vector.move(
+            self.positions, actions, self._directions, self.grids.shape[1:], stepping
+        )
+        hits = vector.modify(self.grids, self.positions, stepping, *self._substitutions)
+
+        self.freezes[stepping] -= 1
+        self.freezes[updating] = self.prototype._max_freeze
+
+        rewards = self._reward_weights @ self._counts() / (self.nrows * self.ncols)
+        terminations = np.zeros(self.num_envs, dtype=bool)
+
+        return rewards, terminations, {"hit": hits, "_hit": stepping}
+
+    def _get_state(self):
+        return self.grids, (self.ca_params, self.positions, self.freezes)
+
+    def _counts(self):
+        """Empty, tree and fire counts, shape (3, N)."""
+        return np.stack(
+            [
+                np.count_nonzero(self.grids == cell, axis=(1, 2))
+                for cell in (self._empty, self._tree, self._fire)
+            ]
+        )
+
+    def _set_spaces(self):
+        proto, n = self.prototype, self.num_envs
+
+        self._grid_dtype = proto.grid_space.dtype
+
+        self.initial_grid_space = GridSpace(
+            values=proto.grid_space.values,
+            shape=(self.nrows, self.ncols),
+            dtype=self._grid_dtype,
+        )
+
+        self.observation_space = batch_space(self.single_observation_space, n)
+        self.action_space = batch_space(self.single_action_space, n)
@@ -1,7 +1,13 @@
 import numpy as np
 from gymnasium import spaces
 
-from gym_cellular_automata.forest_fire.utils.neighbors import neighborhood_at
+from gym_cellular_automata.forest_fire.utils.neighbors import PaddedGrid
+from gym_cellular_automata.forest_fire.utils.packed_grid import (
+    PackedGrid,
+    bernoulli,
+    or_rows,
+    shift_columns,
+)
 from gym_cellular_automata.operator import Operator
 
 
@@ -12,24 +18,59 @@ class ForestFire(Operator):
 
     deterministic = False
 
-    def __init__(self, empty, tree, fire, *args, **kwargs):
+    # "vectorized": whole-grid NumPy update
+    # "loop": per-cell update, the reference implementation
+    # "packed": bitwise update of a `PackedGrid`, 64 cells per word
+    engines = ("vectorized", "loop", "packed")
+
+    # Engines of dense grids, those of the envs
+    dense_engines = ("vectorized", "loop")
+
+    # Moore's neighborhood offsets, self excluded
+    _offsets = tuple(
+        (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+    )
+
+    def __init__(self, empty, tree, fire, *args, engine="vectorized", **kwargs):
         super().__init__(*args, **kwargs)
 
         self.empty = empty
         self.tree = tree
         self.fire = fire
 
+        if engine not in self.engines:
+            raise ValueError(
+                f"Unknown engine '{engine}', expected one of {self.engines}."
+            )
+
+        self.engine = engine
+
+        # Scratch buffers of the vectorized engine, allocated on first use
+        self._buffers_shape = None
+
         if self.context_space is None:
             self.context_space = spaces.Box(0.0, 1.0, shape=(2,))
 
     def update(self, grid, action, context):
+        p_fire, p_tree = context
+
+        if self.engine == "loop":
+            return self._update_loop(grid, p_fire, p_tree), context
+
+        if self.engine == "packed":
+            return self._update_packed(grid, p_fire, p_tree), context
+
+        return self._update_vectorized(grid, p_fire, p_tree), context
+
+    def _update_loop(self, grid, p_fire, p_tree):
         # A copy is needed for the sequential update of a CA
         new_grid = grid.copy()
-        p_fire, p_tree = context
+
+        padded = PaddedGrid(grid, 1, invariant=self.empty)
 
         for row, cells in enumerate(grid):
             for col, cell in enumerate(cells):
-                neighbors = neighborhood_at(grid, (row, col), invariant=self.empty)
+                neighbors = padded.window((row, col))
 
                 if cell == self.tree and self.fire in neighbors:
                     # Burn tree to the ground
@@ -55,4 +96,93 @@ class ForestFire(Operator):
                     # Consume fire
                     new_grid[row][col] = self.empty
 
-        return new_grid, context
+        return new_grid
+
+    def _update_vectorized(self, grid, p_fire, p_tree):
+        """
+        Whole-grid update.
+
+        Leading dimensions of `grid` are treated as a batch of grids,
+        `p_fire` and `p_tree` must broadcast against them.
+        """
+        self._allocate_buffers(grid.shape)
+
+        padded, burning, uniform = self._padded, self._burning, self._uniform
+
+        # Fire mask inside an invariant (non burning) border
+        is_fire = padded[..., 1:-1, 1:-1]
+        np.equal(grid, self.fire, out=is_fire)
+
+        # Any burning cell on the Moore's neighborhood
+        nrows, ncols = grid.shape[-2:]
+        burning.fill(False)
+        for dr, dc in self._offsets:
+            np.logical_or(
+                burning,
+                padded[..., 1 + dr : 1 + dr + nrows, 1 + dc : 1 + dc + ncols],
+                out=burning,
+            )
+
+        # A single draw serves both lightning strikes and tree growth
+        self.np_random.random(out=uniform)
+
+        p_fire = np.asarray(p_fire)[..., None, None]
+        p_tree = np.asarray(p_tree)[..., None, None]
+
+        ignite = (grid == self.tree) & (burning | (uniform < p_fire))
+        growth = (grid == self.empty) & (uniform < p_tree)
+
+        new_grid = grid.copy()
+        np.copyto(new_grid, self.empty, where=is_fire, casting="unsafe")
+        np.copyto(new_grid, self.fire, where=ignite, casting="unsafe")
+        np.copyto(new_grid, self.tree, where=growth, casting="unsafe")
+
+        return new_grid
+
+    def _update_packed(self, grid, p_fire, p_tree):
+        """
+        Bitwise update, a `PackedGrid` is returned packed.
+        Dense grids are packed and unpacked around the update.
+
+        Lightning strikes and tree growth are sampled as bit planes,
+        their probabilities must broadcast against the batch of grids.
+        """
+        if not isinstance(grid, PackedGrid):
+            packed = PackedGrid.pack(grid, self.empty, self.tree, self.fire)
+            return self._update_packed(packed, p_fire, p_tree).unpack()
+
+        tree, fire = grid.tree, grid.fire
+
+        # Burning cells of the Moore's neighborhood, the cell included,
+        # as a burning cell is not a tree
+        rows = fire | shift_columns(fire, -1) | shift_columns(fire, 1)
+
+        burning = rows.copy()
+        or_rows(burning, rows, -1)
+        or_rows(burning, rows, 1)
+
+        # The same draws serve both lightning strikes and tree growth
+        strike, growth = bernoulli(
+            self.np_random,
+            tree.shape,
+            np.asarray(p_fire)[..., None, None],
+            np.asarray(p_tree)[..., None, None],
+        )
+
+        ignite = tree & (burning | strike)
+        empty = ~(tree | fire) & grid.valid
+
+        # FIRE -> EMPTY, as it is on neither plane
+        return grid.replace((tree & ~ignite) | (empty & growth), ignite)
+
+    def _allocate_buffers(self, shape):
+        if self._buffers_shape == shape:
+            return
+
+        *batch, nrows, ncols = shape
+
+        self._padded = np.zeros((*batch, nrows + 2, ncols + 2), dtype=bool)
+        self._burning = np.empty(shape, dtype=bool)
+        self._uniform = np.empty(shape, dtype=np.float64)
+
+        self._buffers_shape = shape
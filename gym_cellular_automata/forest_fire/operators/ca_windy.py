@@ -2,8 +2,12 @@ from collections import namedtuple
 
 import numpy as np
 from gymnasium import spaces
-from scipy.signal import convolve2d
 
+from gym_cellular_automata.forest_fire.utils.packed_grid import (
+    PackedGrid,
+    or_rows,
+    shift_columns,
+)
 from gym_cellular_automata.operator import Operator
 
 
@@ -22,7 +26,36 @@ class WindyForestFire(Operator):
     _row_k = 3
     _col_k = 3
 
-    def __init__(self, empty=0, tree=3, fire=25, *args, **kwargs):
+    # "stencil": shifted adds of burning neighbors and a lookup table
+    # "sparse": only the burning cells and their frontier are visited
+    # "convolve": scipy convolution, the reference implementation
+    # "packed": bitwise update of a `PackedGrid`, 64 cells per word
+    engines = ("stencil", "sparse", "convolve", "packed")
+
+    # Engines of dense grids, those of the envs
+    dense_engines = ("stencil", "sparse", "convolve")
+
+    # Fraction of burning cells above which "sparse" falls back to "stencil"
+    sparse_threshold = 0.05
+
+    # Moore's neighborhood offsets, self excluded
+    _offsets = tuple(
+        (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+    )
+
+    # Uniforms drawn at once from `np_random`, then consumed in order
+    block_size = 2**12
+
+    def __init__(
+        self,
+        empty=0,
+        tree=3,
+        fire=25,
+        *args,
+        engine="stencil",
+        per_cell=False,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         # Cell Values
@@ -30,50 +63,459 @@ class WindyForestFire(Operator):
         self._tree = tree
         self._fire = fire
 
+        if engine not in self.engines:
+            raise ValueError(
+                f"Unknown engine '{engine}', expected one of {self.engines}."
+            )
+
+        self.engine = engine
+
+        # Each burning neighbor of each tree propagates independently,
+        # instead of a single failure mask shared by all cells
+        self.per_cell = per_cell
+
+        if per_cell and engine == "packed":
+            raise ValueError("The per cell mode does not run on packed grids.")
+
         self._assert_correctness()
 
         self.breaks = self._get_breaks()
 
+        # Failure masks as 8 bits, a bit per offset
+        # The convolution flips the kernel,
+        # the weight at (1 - dr, 1 - dc) applies to the neighbor at (dr, dc)
+        self._mask_cells = np.array(
+            [(1 - dr) * 3 + (1 - dc) for dr, dc in self._offsets]
+        )
+        self._mask_bits = 1 << np.arange(len(self._offsets))
+
+        # Precomputed by mask, the 256 kernels and the offsets that propagate
+        self._kernels = self._get_kernels()
+        self._propagating = self._get_propagating_offsets()
+
+        # Prefetched uniforms, `_block` starts at the RNG state `_block_state`
+        self._block = None
+        self._block_rng = None
+        self._block_state = None
+        self._block_offset = 0
+
+        # Stencil engine state
+        self._lut = self._get_lut()
+        self._luts = {}
+        self._buffers_shape = None
+
+        # Sparse engine state
+        self._front_grid = None
+        self._burning = None
+
         if self.context_space is None:
             self.context_space = spaces.Box(0.0, 1.0, shape=(3, 3))
 
     def update(self, grid, action, wind):
+        # Only the sparse engine knows the changed cells
+        self.diff = None
+
+        if self.per_cell:
+            return self._update_per_cell(grid, wind), wind
+
         # Sample which FIREs fail to propagate this update
         fail_to_propagate = self._get_failed_propagations_mask(wind)
 
+        if self.engine == "convolve":
+            new_grid = self._update_convolve(grid, fail_to_propagate)
+
+        elif self.engine == "sparse":
+            new_grid = self._update_sparse(grid, fail_to_propagate)
+
+        elif self.engine == "packed":
+            new_grid = self._update_packed(grid, fail_to_propagate)
+
+        else:
+            new_grid = self._update_stencil(grid, fail_to_propagate)
+
+        return new_grid, wind
+
+    def _update_convolve(self, grid, fail_to_propagate):
         kernel = self._get_kernel(fail_to_propagate)
 
         grid_signal = self._convolve(grid, kernel)
 
         new_grid = self._translate_analogic_to_discrete(grid_signal, self.breaks)
 
-        return new_grid, wind
+        # The convolution widens the grid, cast it back
+        return new_grid.astype(grid.dtype, copy=False)
+
+    def _update_stencil(self, grid, fail_to_propagate):
+        """
+        Counts the burning neighbors that succeed to propagate,
+        then maps (cell, count) to the next cell through a lookup table.
+
+        Leading dimensions of `grid` are treated as a batch of grids,
+        each one with its own failure mask at `fail_to_propagate`.
+        """
+        self._allocate_buffers(grid.shape)
+
+        padded, count = self._padded, self._count
+        nrows, ncols = grid.shape[-2:]
+
+        # Fire indicator inside an invariant (non burning) border
+        np.equal(grid, self._fire, out=padded[..., 1:-1, 1:-1])
+
+        count.fill(0)
+
+        if fail_to_propagate.ndim == 2:
+            for dr, dc in self._propagating[self._get_mask_index(fail_to_propagate)]:
+                neighbor = padded[1 + dr : 1 + dr + nrows, 1 + dc : 1 + dc + ncols]
+                np.add(count, neighbor, out=count)
+
+            return self._get_typed_lut(grid.dtype)[grid, count]
+
+        propagates = np.logical_not(fail_to_propagate)
+
+        for dr, dc in self._offsets:
+            allowed = propagates[..., 1 - dr, 1 - dc]
+
+            if not np.any(allowed):
+                continue
+
+            neighbor = padded[..., 1 + dr : 1 + dr + nrows, 1 + dc : 1 + dc + ncols]
+            np.add(count, neighbor, out=count, where=allowed[..., None, None])
+
+        return self._get_typed_lut(grid.dtype)[grid, count]
+
+    def _update_packed(self, grid, fail_to_propagate):
+        """
+        Bitwise update, a `PackedGrid` is returned packed.
+        Dense grids are packed and unpacked around the update.
+
+        Fire spreads by word-wide shifts of the FIRE plane,
+        a column shift per `dc` and an OR of rows per `dr`.
+        """
+        if not isinstance(grid, PackedGrid):
+            packed = PackedGrid.pack(grid, self._empty, self._tree, self._fire)
+            return self._update_packed(packed, fail_to_propagate).unpack()
+
+        tree, fire = grid.tree, grid.fire
+        spread = np.zeros_like(fire)
+
+        if fail_to_propagate.ndim == 2:
+            propagating = self._propagating[self._get_mask_index(fail_to_propagate)]
+
+            for dc in (-1, 0, 1):
+                rows = [dr for dr, offset_dc in propagating if offset_dc == dc]
+
+                if rows:
+                    shifted = shift_columns(fire, dc)
+
+                    for dr in rows:
+                        or_rows(spread, shifted, dr)
+
+        else:
+            # A mask per grid, the words of failed neighbors are zeroed
+            propagates = np.logical_not(fail_to_propagate)
+
+            for dr, dc in self._offsets:
+                allowed = propagates[..., 1 - dr, 1 - dc, None, None]
+
+                if np.any(allowed):
+                    or_rows(spread, shift_columns(fire, dc) * allowed, dr)
+
+        # Propagate: TREE -> FIRE
+        # Consume: FIRE -> EMPTY, as it is on neither plane
+        ignite = tree & spread
+
+        return grid.replace(tree & ~ignite, ignite)
+
+    def _update_per_cell(self, grid, wind):
+        """
+        Independent propagation, a burning neighbor at (dr, dc)
+        ignites a tree with probability `wind[..., 1 - dr, 1 - dc]`.
+
+        The burning neighbors of a cell are packed as bits of a byte,
+        bit i for the neighbor at `_offsets[i]`.
+        Only trees with burning neighbors sample a byte of successes,
+        a tree ignites if both bytes share a bit.
+
+        Leading dimensions of `grid` are a batch of grids,
+        `wind` is either shared, shape (3, 3), or one per grid.
+        """
+        self._allocate_buffers(grid.shape)
+
+        padded, burning = self._padded, self._count
+        nrows, ncols = grid.shape[-2:]
+
+        np.equal(grid, self._fire, out=padded[..., 1:-1, 1:-1])
+
+        burning.fill(0)
+        for bit, (dr, dc) in enumerate(self._offsets):
+            neighbor = padded[..., 1 + dr : 1 + dr + nrows, 1 + dc : 1 + dc + ncols]
+            np.bitwise_or(burning, neighbor << np.uint8(bit), out=burning)
+
+        # Flat indices
+        exposed = np.flatnonzero((grid == self._tree) & (burning != 0))
+
+        # Propagation probabilities in bit order, shape (..., 8)
+        probs = np.reshape(wind, (-1, 9))[:, self._mask_cells]
+
+        if len(probs) > 1:
+            probs = probs[exposed // (nrows * ncols)]
+
+        uniforms = self._get_uniforms((exposed.size, len(self._offsets)))
+        succeeds = np.packbits(uniforms < probs, axis=-1, bitorder="little")[:, 0]
+
+        ignites = (burning.ravel()[exposed] & succeeds) != 0
+
+        # Without burning neighbors: FIRE -> EMPTY, TREE -> TREE
+        new_grid = self._get_typed_lut(grid.dtype)[grid, 0]
+        new_grid.ravel()[exposed[ignites]] = self._fire
+
+        return new_grid
+
+    def _update_sparse(self, grid, fail_to_propagate):
+        """
+        Active front update.
+
+        Burning cells are kept as flat indices between calls,
+        so only they and the trees around them are visited.
+        Falls back to the stencil engine on batches and large fronts.
+
+        The output is still a copy of the whole grid, O(H*W),
+        as returned grids are kept by the envs and their callers.
+        Cells changed in place between updates must be reported by `track_diff`.
+        """
+        if grid.ndim != 2:
+            return self._update_stencil(grid, fail_to_propagate)
+
+        burning = self._get_front(grid)
+
+        if burning.size > self.sparse_threshold * grid.size:
+            new_grid = self._update_stencil(grid, fail_to_propagate)
+            self._track_front(new_grid, np.flatnonzero(new_grid == self._fire))
+
+            return new_grid
+
+        nrows, ncols = grid.shape
+        rows, cols = np.divmod(burning, ncols)
+
+        ignited = []
+
+        for dr, dc in self._propagating[self._get_mask_index(fail_to_propagate)]:
+            # Fire at (row, col) reaches the tree at (row - dr, col - dc)
+            trow, tcol = rows - dr, cols - dc
+            inside = (trow >= 0) & (trow < nrows) & (tcol >= 0) & (tcol < ncols)
+
+            targets = trow[inside] * ncols + tcol[inside]
+            ignited.append(targets[grid.flat[targets] == self._tree])
+
+        ignited = np.unique(np.concatenate(ignited)) if ignited else burning[:0]
+
+        # Copying is the only full grid operation
+        new_grid = grid.copy()
+
+        # Consume
+        # FIRE -> EMPTY
+        new_grid.flat[burning] = self._empty
+
+        # Propagate
+        # TREE -> FIRE
+        new_grid.flat[ignited] = self._fire
+
+        self._track_front(new_grid, ignited)
+
+        self.diff = (
+            np.concatenate((burning, ignited)),
+            np.repeat([self._fire, self._tree], [burning.size, ignited.size]),
+            np.repeat([self._empty, self._fire], [burning.size, ignited.size]),
+        )
+
+        return new_grid
+
+    def _get_front(self, grid):
+        if grid is not self._front_grid or not self._is_front_valid(grid):
+            # Resynchronize, e.g. on a freshly reset grid
+            self._track_front(grid, np.flatnonzero(grid == self._fire))
+
+        return self._burning
+
+    def _track_front(self, grid, burning):
+        self._front_grid = grid
+        self._burning = burning
+
+    def _is_front_valid(self, grid):
+        # Fires put out in place between updates, e.g. by `Modify`
+        return bool(np.all(grid.flat[self._burning] == self._fire))
+
+    def track_diff(self, grid, diff):
+        """
+        Tracks the cells of the sparse engine front changed in place on `grid`,
+        its last output, `diff` as (flat indices, old values, new values).
+        An unknown diff, None, rescans the grid on the next update.
+        """
+        if grid is not self._front_grid:
+            return
+
+        if diff is None:
+            self._front_grid = None
+            return
+
+        indices, old, new = diff
+
+        lit = indices[new == self._fire]
+        out = indices[(old == self._fire) & (new != self._fire)]
+
+        if lit.size or out.size:
+            burning = np.setdiff1d(self._burning, out, assume_unique=True)
+            self._burning = np.union1d(burning, lit)
+
+    def _get_lut(self):
+        """
+        Next cell value indexed by (cell value, burning neighbors).
+        """
+        assert self._empty >= 0, "Lookup tables need non-negative cell values"
+
+        n = len(self._offsets)
+        cells = np.arange(self._fire + 1)
+
+        # Cells outside of the CA states are left as they are
+        lut = np.repeat(cells, n + 1).reshape(len(cells), n + 1)
+
+        # 1. Dead
+        # EMPTY -> EMPTY
+        lut[self._empty, :] = self._empty
+
+        # 2. Keep
+        # TREE -> TREE
+        lut[self._tree, 0] = self._tree
+
+        # 3. Propagate
+        # TREE -> FIRE
+        lut[self._tree, 1:] = self._fire
+
+        # 4. Consume
+        # FIRE -> EMPTY
+        lut[self._fire, :] = self._empty
+
+        return lut
+
+    def _get_typed_lut(self, dtype):
+        if dtype not in self._luts:
+            self._luts[dtype] = self._lut.astype(dtype)
+
+        return self._luts[dtype]
+
+    def _allocate_buffers(self, shape):
+        if self._buffers_shape == shape:
+            return
+
+        *batch, nrows, ncols = shape
+
+        # Up to 8 burning neighbors, a byte is enough
+        self._padded = np.zeros((*batch, nrows + 2, ncols + 2), dtype=np.uint8)
+        self._count = np.empty(shape, dtype=np.uint8)
+
+        self._buffers_shape = shape
 
     def _get_failed_propagations_mask(self, wind):
         """
         Here goes the only sampling of the step.
+
+        A batch of winds, shape (..., 3, 3), samples a mask per wind.
         """
-        uniform_space = spaces.Box(low=0.0, high=1.0, shape=(self._row_k, self._col_k))
-        uniform_roll = uniform_space.sample()
+        uniform_roll = self._get_uniforms(np.shape(wind))
 
-        failed_propagations = np.repeat(False, self._row_k * self._col_k).reshape(
-            self._row_k, self._col_k
-        )
         failed_propagations = wind <= uniform_roll
 
         return failed_propagations
 
+    def _get_uniforms(self, shape):
+        """
+        Uniforms from `np_random` by blocks of `block_size`.
+        Draws are consumed in order, the same as `np_random.random(shape)`.
+        """
+        size = int(np.prod(shape))
+        parts = []
+
+        while size > 0:
+            if self._block_rng is not self.np_random or self._block_offset == len(
+                self._block
+            ):
+                self._refill()
+
+            start = self._block_offset
+            self._block_offset = min(start + size, len(self._block))
+
+            parts.append(self._block[start : self._block_offset])
+            size -= self._block_offset - start
+
+        if not parts:
+            return np.empty(shape)
+
+        uniforms = parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+        return uniforms.reshape(shape)
+
+    def _refill(self, offset=0):
+        generator = self.np_random
+
+        self._block_rng = generator
+        self._block_state = generator.bit_generator.state
+        self._block = generator.random(self.block_size)
+        self._block_offset = offset
+
+    def get_rng_state(self):
+        """Logical state of `np_random`, the block start and the draws consumed."""
+        if self._block_rng is not self.np_random:
+            return {"block_state": None, "state": self.np_random.bit_generator.state}
+
+        return {"block_state": self._block_state, "offset": self._block_offset}
+
+    def set_rng_state(self, state):
+        if state["block_state"] is None:
+            self.np_random.bit_generator.state = state["state"]
+            self._block_rng = None
+            return
+
+        # The block is drawn again
+        self.np_random.bit_generator.state = state["block_state"]
+        self._refill(state["offset"])
+
+    def _get_mask_index(self, failed_propagations):
+        """A failure mask, shape (3, 3), as an index of 8 bits."""
+        return int(failed_propagations.ravel()[self._mask_cells] @ self._mask_bits)
+
     def _get_kernel(self, failed_propagations):
-        kernel = np.repeat(self._propagation, self._row_k * self._col_k).reshape(
-            self._row_k, self._col_k
-        )
+        return self._kernels[self._get_mask_index(failed_propagations)]
+
+    def _get_kernels(self):
+        """Convolution kernel by failure mask index."""
+        kernels = np.full((2 ** len(self._offsets), 3, 3), self._propagation)
 
-        kernel[failed_propagations] = self._empty
-        kernel[1, 1] = self._identity
+        for index, kernel in enumerate(kernels):
+            failed = (index & self._mask_bits) > 0
+            kernel.ravel()[self._mask_cells[failed]] = self._empty
 
-        return kernel
+        kernels[:, 1, 1] = self._identity
+
+        # Shared between updates
+        kernels.flags.writeable = False
+
+        return kernels
+
+    def _get_propagating_offsets(self):
+        """Offsets of the neighbors that propagate fire, by failure mask index."""
+        return [
+            tuple(
+                offset
+                for offset, bit in zip(self._offsets, self._mask_bits)
+                if not index & bit
+            )
+            for index in range(2 ** len(self._offsets))
+        ]
 
     def _convolve(self, grid, kernel):
+        # Only the reference engine depends on scipy
+        from scipy.signal import convolve2d
+
         return convolve2d(
             grid, kernel, mode="same", boundary="fill", fillvalue=self._empty
         )
@@ -3,7 +3,7 @@ from typing import Dict, Set
 import numpy as np
 from gymnasium import logger, spaces
 
-from gym_cellular_automata.operator import Operator
+from gym_cellular_automata.operator import Operator, chain_diffs, no_diff
 
 
 class Move(Operator):
@@ -64,6 +64,8 @@ class Move(Operator):
 
             return np.array([row, col])
 
+        self.diff = no_diff()
+
         return grid, get_new_position(context)
 
 
@@ -83,14 +85,24 @@ class Modify(Operator):
 
     def update(self, grid, action, context):
         self.hit = False
+        self.diff = no_diff()
 
         row, col = context
 
         if action:
             if grid[row, col] in self.effects:
+                # Shared read-only grids, e.g. restored snapshots, are copied on write
+                if not grid.flags.writeable:
+                    grid = grid.copy()
+
+                old = grid[row, col]
                 grid[row, col] = self.effects[grid[row, col]]
                 self.hit = True
 
+                index = np.ravel_multi_index((row, col), grid.shape)
+                new = grid[row, col]
+                self.diff = np.array([index]), np.array([old]), np.array([new])
+
         return grid, context
 
 
@@ -131,4 +143,6 @@ class MoveModify(Operator):
         grid, position = self.move(grid, move_action, position)
         grid, position = self.modify(grid, modify_action, position)
 
+        self.diff = chain_diffs(self.move.diff, self.modify.diff)
+
         return grid, position
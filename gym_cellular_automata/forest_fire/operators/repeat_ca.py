@@ -4,7 +4,7 @@ from typing import Callable
 import numpy as np
 
 from gym_cellular_automata._config import TYPE_BOX
-from gym_cellular_automata.operator import Operator
+from gym_cellular_automata.operator import Operator, chain_diffs, no_diff
 
 
 class RepeatCA(Operator):
@@ -39,7 +39,12 @@ class RepeatCA(Operator):
         accu_time += time_taken
         accu_time, repeats = math.modf(accu_time)
 
+        diffs = [no_diff()]
+
         for repeat in range(int(repeats)):
             grid, ca_params = self.ca(grid, action, ca_params)
+            diffs.append(self.ca.diff)
+
+        self.diff = chain_diffs(*diffs)
 
         return grid, (ca_params, np.array(accu_time, dtype=TYPE_BOX))
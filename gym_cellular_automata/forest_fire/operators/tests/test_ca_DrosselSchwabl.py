@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from gymnasium import spaces
 
@@ -39,8 +40,8 @@ def position_space():
     return spaces.MultiDiscrete([ROW, COL])
 
 
-@pytest.fixture
-def ca(grid_space, ca_params_space):
+@pytest.fixture(params=ForestFire.engines)
+def ca(request, grid_space, ca_params_space):
     dummy_space = ca_params_space
     return ForestFire(
         EMPTY,
@@ -49,6 +50,7 @@ def ca(grid_space, ca_params_space):
         grid_space=grid_space,
         action_space=dummy_space,
         context_space=ca_params_space,
+        engine=request.param,
     )
 
 
@@ -74,6 +76,55 @@ def test_forest_fire_update(ca, grid_space, ca_params_space, position_space):
         grid = new_grid
 
 
+@pytest.mark.repeat(TESTS)
+@pytest.mark.parametrize("engine", ["vectorized", "packed"])
+def test_engines_agree_without_sampling(grid_space, engine):
+    # Without lightning nor growth the update is deterministic
+    no_sampling = np.array([0.0, 0.0])
+
+    loop = ForestFire(EMPTY, TREE, FIRE, engine="loop")
+    other = ForestFire(EMPTY, TREE, FIRE, engine=engine)
+
+    grid = grid_space.sample()
+
+    for step in range(STEPS):
+        expected, __ = loop(grid, None, no_sampling)
+        observed, __ = other(grid, None, no_sampling)
+
+        assert np.all(observed == expected)
+        assert observed.dtype == grid.dtype
+
+        grid = expected
+
+
+def test_packed_grids_stay_packed():
+    from gym_cellular_automata.forest_fire.utils.packed_grid import PackedGrid
+
+    ca = ForestFire(EMPTY, TREE, FIRE, engine="packed")
+    ca.seed(0)
+
+    # A batch of empty grids, growth probabilities by grid
+    grids = np.full((2, 64, 100), EMPTY)
+    p_fire, p_tree = np.array([0.0, 0.0]), np.array([0.25, 0.75])
+
+    packed, __ = ca(PackedGrid.pack(grids, EMPTY, TREE, FIRE), None, (p_fire, p_tree))
+    assert isinstance(packed, PackedGrid)
+
+    grown = np.mean(packed.unpack() == TREE, axis=(1, 2))
+    assert np.allclose(grown, p_tree, atol=0.03)
+
+    # Always lightning, every TREE burns
+    trees = packed.count(TREE)
+    packed, __ = ca(packed, None, (1.0, 0.0))
+
+    assert packed.count(FIRE) == trees and packed.count(TREE) == 0
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        ForestFire(EMPTY, TREE, FIRE, engine="unknown")
+
+
 def assert_forest_fire_update_at_positionrows_col(grid, new_grid, row, col):
     log_error = (
         f"\n row: {row}"
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from gymnasium import spaces
 
@@ -24,9 +25,9 @@ ROW = 4
 COL = 4
 
 
-@pytest.fixture
-def ca():
-    return WindyForestFire(EMPTY, TREE, FIRE)
+@pytest.fixture(params=WindyForestFire.engines)
+def ca(request):
+    return WindyForestFire(EMPTY, TREE, FIRE, engine=request.param)
 
 
 # Deterministic Wind
@@ -69,6 +70,195 @@ def test_windy_forest_fire_update(ca, grid_space, wind, position_space):
         grid = new_grid
 
 
+@pytest.mark.repeat(TESTS)
+@pytest.mark.parametrize("dtype", [np.int32, np.uint8])
+def test_engines_agree(grid_space, dtype):
+    stencil = WindyForestFire(EMPTY, TREE, FIRE, engine="stencil")
+    convolve = WindyForestFire(EMPTY, TREE, FIRE, engine="convolve")
+    packed = WindyForestFire(EMPTY, TREE, FIRE, engine="packed")
+
+    grid = grid_space.sample().astype(dtype)
+
+    for step in range(STEPS):
+        # Same failure mask for all engines
+        fail_to_propagate = np.random.random((3, 3)) < 0.5
+
+        expected = convolve._update_convolve(grid, fail_to_propagate)
+
+        for observed in (
+            stencil._update_stencil(grid, fail_to_propagate),
+            packed._update_packed(grid, fail_to_propagate),
+        ):
+            assert np.all(observed == expected)
+            assert observed.dtype == grid.dtype
+
+        grid = observed
+
+
+@pytest.mark.repeat(TESTS)
+def test_packed_engine_on_batches():
+    from gym_cellular_automata.forest_fire.utils.packed_grid import PackedGrid
+
+    stencil = WindyForestFire(EMPTY, TREE, FIRE, engine="stencil")
+    packed = WindyForestFire(EMPTY, TREE, FIRE, engine="packed")
+
+    # Columns over a word
+    grids = GridSpace(
+        values=[EMPTY, TREE, FIRE], probs=[0.1, 0.7, 0.2], shape=(3, 8, 70)
+    ).sample()
+    packed_grids = PackedGrid.pack(grids, EMPTY, TREE, FIRE)
+
+    for step in range(STEPS):
+        fail_to_propagate = np.random.random((3, 3, 3)) < 0.5
+
+        grids = stencil._update_stencil(grids, fail_to_propagate)
+        packed_grids = packed._update_packed(packed_grids, fail_to_propagate)
+
+        assert isinstance(packed_grids, PackedGrid)
+        assert np.all(packed_grids.unpack() == grids)
+
+
+@pytest.mark.repeat(TESTS)
+@pytest.mark.parametrize("sparse_threshold", [0.0, 1.0])
+def test_sparse_engine_tracks_front(sparse_threshold):
+    sparse = WindyForestFire(EMPTY, TREE, FIRE, engine="sparse")
+    sparse.sparse_threshold = sparse_threshold
+
+    stencil = WindyForestFire(EMPTY, TREE, FIRE, engine="stencil")
+
+    grid = GridSpace(
+        values=[EMPTY, TREE, FIRE], probs=[0.1, 0.85, 0.05], shape=(16, 16)
+    ).sample()
+
+    for step in range(STEPS):
+        fail_to_propagate = np.random.random((3, 3)) < 0.5
+
+        expected = stencil._update_stencil(grid, fail_to_propagate)
+        observed = sparse._update_sparse(grid, fail_to_propagate)
+
+        assert np.all(observed == expected)
+
+        # In place modifications between updates, as Modify does,
+        # fires set outside of the front are reported by their diff
+        observed[0, 0] = EMPTY
+
+        old = observed[-1, -1]
+        observed[-1, -1] = FIRE
+
+        diff = np.array([observed.size - 1]), np.array([old]), np.array([FIRE])
+        sparse.track_diff(observed, diff)
+
+        grid = observed
+
+
+@pytest.mark.repeat(TESTS)
+def test_per_cell_update(grid_space, position_space):
+    ca = WindyForestFire(EMPTY, TREE, FIRE, per_cell=True)
+    wind = ca.context_space.high
+
+    grid = grid_space.sample()
+
+    for step in range(STEPS):
+        new_grid, __ = ca(grid, None, wind)
+
+        for check in range(CHECKS_PER_STEP):
+            row, col = position_space.sample()
+
+            assert_forest_fire_update_at_positionrows_col(grid, new_grid, row, col)
+
+        grid = new_grid
+
+
+def test_per_cell_propagation():
+    ca = WindyForestFire(EMPTY, TREE, FIRE, per_cell=True)
+    ca.seed(0)
+
+    wind = np.array([[0.48, 0.64, 0.98], [0.12, 0.00, 0.64], [0.06, 0.12, 0.48]])
+
+    # A FIRE surrounded by TREEs, each TREE has a single burning neighbor
+    grid = np.full((3, 3), TREE)
+    grid[1, 1] = FIRE
+
+    # Batch of grids, each cell burns independently
+    samples = 4096
+    grids = np.repeat(grid[None], samples, axis=0)
+    new_grids, __ = ca(grids, None, wind)
+
+    ignited = np.mean(new_grids == FIRE, axis=0)
+
+    # The TREE at (r, c) is reached by the FIRE at offset (1 - r, 1 - c)
+    assert np.allclose(ignited, wind, atol=0.04)
+    assert np.all(new_grids[:, 1, 1] == EMPTY)
+
+
+def test_per_cell_batch_of_winds():
+    ca = WindyForestFire(EMPTY, TREE, FIRE, per_cell=True)
+
+    grid = np.full((2, 8, 8), TREE, dtype=np.uint8)
+    grid[:, 4, 4] = FIRE
+
+    winds = np.stack([np.ones((3, 3)), np.zeros((3, 3))])
+    new_grid, __ = ca(grid, None, winds)
+
+    assert np.count_nonzero(new_grid[0] == FIRE) == 8
+    assert np.count_nonzero(new_grid[1] == FIRE) == 0
+    assert new_grid.dtype == grid.dtype
+
+
+def test_prefetched_uniforms_are_sequential():
+    ca = WindyForestFire(EMPTY, TREE, FIRE)
+    ca.seed(7)
+    ca.block_size = 64
+
+    reference = np.random.default_rng(7)
+
+    # Shapes straddling the block boundaries
+    for shape in [(3, 3), (5, 3, 3), (1,), (60,), (2, 40), (3, 3)]:
+        assert np.array_equal(ca._get_uniforms(shape), reference.random(shape))
+
+
+def test_rng_state_restores_block_position(grid_space):
+    ca = WindyForestFire(EMPTY, TREE, FIRE)
+    ca.seed(3)
+    ca.block_size = 32
+
+    grid = grid_space.sample()
+    wind = np.full((3, 3), 0.5)
+
+    def rollout(grid, steps=8):
+        grids = []
+        for step in range(steps):
+            grid, __ = ca(grid, None, wind)
+            grids.append(grid)
+        return grids
+
+    grid = rollout(grid, 5)[-1]
+    state = ca.get_rng_state()
+
+    expected = rollout(grid)
+    ca.set_rng_state(state)
+
+    assert all(np.array_equal(o, e) for o, e in zip(rollout(grid), expected))
+
+
+def test_cached_kernels():
+    ca = WindyForestFire(EMPTY, TREE, FIRE)
+
+    for step in range(TESTS):
+        failed = np.random.random((3, 3)) < 0.5
+
+        kernel = np.full((3, 3), ca._propagation)
+        kernel[failed] = ca._empty
+        kernel[1, 1] = ca._identity
+
+        assert np.array_equal(ca._get_kernel(failed), kernel)
+
+        propagating = ca._propagating[ca._get_mask_index(failed)]
+        assert propagating == tuple(
+            (dr, dc) for dr, dc in ca._offsets if not failed[1 - dr, 1 - dc]
+        )
+
+
 def assert_forest_fire_update_at_positionrows_col(grid, new_grid, row, col):
     log_error = (
         f"\n row: {row}"
@@ -1,6 +1,7 @@
 from typing import Union
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def moore_n(
@@ -11,144 +12,97 @@ def moore_n(
     row, col = position
     nrows, ncols = grid.shape
 
-    # Target offsets from position.
-    ofup, ofdo = row + np.array([-n, +n])
-    ofle, ofri = col + np.array([-n, +n])
+    # Cells of the neighborhood out of the grid, per side
+    pads = (
+        (max(n - row, 0), max(row + n + 1 - nrows, 0)),
+        (max(n - col, 0), max(col + n + 1 - ncols, 0)),
+    )
 
-    try:
-        if ofup < 0 or ofle < 0 or ofdo + 1 > nrows or ofri + 1 > ncols:
-            raise IndexError
+    window = grid[max(row - n, 0) : row + n + 1, max(col - n, 0) : col + n + 1]
 
+    if not any(pads[0] + pads[1]):
         # Current Grid is enough, just return the requested values.
-        return grid[ofup : ofdo + 1, ofle : ofri + 1]
-
-    except IndexError:
-        invariant = np.array(invariant, dtype=grid.dtype)
-
-        # 1. Generate extended grid.
-
-        # Grid lenght at step N.
-        l = lambda n: 2 * n + 1
-        ln = l(n)
-        egrid = np.repeat(invariant, ln * ln).reshape(ln, ln)
-
-        # 2. Populate middle cell.
-
-        mid = ln // 2
-        egrid[mid, mid] = grid[row, col]
-
-        is_legal = {
-            "up": ofup >= 0,
-            "down": ofdo <= nrows - 1,
-            "left": ofle >= 0,
-            "right": ofri <= ncols - 1,
-        }
-
-        # Distance
-        d = lambda a, b: abs(b - a)
-
-        # 3. Populate Up-Left Corner
-        if is_legal["up"] and is_legal["left"]:
-            egrid[mid - n : mid + 1, mid - n : mid + 1] = grid[
-                row - n : row + 1, col - n : col + 1
-            ]
-
-        elif not is_legal["up"] and not is_legal["left"]:  # Both ilegal
-            br = d(row, 0)
-            bc = d(col, 0)
-            egrid[mid - br : mid + 1, mid - bc : mid + 1] = grid[
-                row - br : row + 1, col - bc : col + 1
-            ]
-
-        elif not is_legal["up"]:
-            br = d(row, 0)  # Distance to the border
-            egrid[mid - br : mid + 1, mid - n : mid + 1] = grid[
-                row - br : row + 1, col - n : col + 1
-            ]
-        elif not is_legal["left"]:
-            bc = d(col, 0)
-            egrid[mid - n : mid + 1, mid - bc : mid + 1] = grid[
-                row - n : row + 1, col - bc : col + 1
-            ]
-
-        # 4. Populate Up-Right Corner
-        if is_legal["up"] and is_legal["right"]:
-            egrid[mid - n : mid + 1, mid : mid + n + 1] = grid[
-                row - n : row + 1, col : col + n + 1
-            ]
-
-        elif not is_legal["up"] and not is_legal["right"]:
-            br = d(row, 0)
-            bc = d(col, ncols)
-            egrid[mid - br : mid + 1, mid : mid + bc] = grid[
-                row - br : row + 1, col : col + bc
-            ]
-
-        elif not is_legal["up"]:
-            br = d(row, 0)
-            egrid[mid - br : mid + 1, mid : mid + n + 1] = grid[
-                row - br : row + 1, col : col + n + 1
-            ]
-
-        elif not is_legal["right"]:
-            bc = d(col, ncols)
-            egrid[mid - n : mid + 1, mid : mid + bc] = grid[
-                row - n : row + 1, col : col + bc
-            ]
-
-        # 5. Populate Down-Left Corner
-        if is_legal["down"] and is_legal["left"]:
-            egrid[mid : mid + n + 1, mid - n : mid + 1] = grid[
-                row : row + n + 1, col - n : col + 1
-            ]
-
-        elif not is_legal["down"] and not is_legal["left"]:
-            br = d(row, nrows)
-            bc = d(col, 0)
-            egrid[mid : mid + br, mid - bc : mid + 1] = grid[
-                row : row + br, col - bc : col + 1
-            ]
-
-        elif not is_legal["down"]:
-            br = d(row, nrows)
-            egrid[mid : mid + br, mid - n : mid + 1] = grid[
-                row : row + br, col - n : col + 1
-            ]
-
-        elif not is_legal["left"]:
-            bc = d(col, 0)
-            egrid[mid : mid + n + 1, mid - bc : mid + 1] = grid[
-                row : row + n + 1, col - bc : col + 1
-            ]
-
-        # 6. Populate Down-Right Corner
-        if is_legal["down"] and is_legal["right"]:
-            egrid[mid : mid + n + 1, mid : mid + n + 1] = grid[
-                row : row + n + 1, col : col + n + 1
-            ]
-
-        elif not is_legal["down"] and not is_legal["right"]:
-            br = d(row, nrows)
-            bc = d(col, ncols)
-            egrid[mid : mid + br, mid : mid + bc] = grid[row : row + br, col : col + bc]
-
-        elif not is_legal["down"]:
-            br = d(row, nrows)
-            egrid[mid : mid + br, mid : mid + n + 1] = grid[
-                row : row + br, col : col + n + 1
-            ]
-
-        elif not is_legal["right"]:
-            bc = d(col, ncols)
-            egrid[mid : mid + n + 1, mid : mid + bc] = grid[
-                row : row + n + 1, col : col + bc
-            ]
-
-        return egrid
-
-
-# Depracated: Still used as interface for CAs.
-# Superseded by Moore N function.
+        return window
+
+    invariant = np.array(invariant, dtype=grid.dtype)
+    return np.pad(window, pads, constant_values=invariant)
+
+
+class PaddedGrid:
+    """
+    Persistent copy of a grid inside an invariant border of width N.
+
+    Every N Moore neighborhood is a zero-copy window of the padded copy.
+    A leading dimension of the grid is treated as a batch of grids.
+
+        Example::
+
+            >>> padded = PaddedGrid(grid, n=1, invariant=empty)
+            >>> padded.window((row, col))
+            >>> padded.windows(positions)
+            >>> padded.update(next_grid)
+
+    """
+
+    def __init__(self, grid: np.ndarray, n: int, invariant: Union[int, np.ndarray] = 0):
+        self.n = n
+        self.invariant = invariant
+
+        self._allocate(grid.shape, grid.dtype)
+        self.update(grid)
+
+    def update(self, grid: np.ndarray):
+        """Copies `grid` inside the border, reallocating only on new shapes."""
+        if grid.shape != self.shape or grid.dtype != self.padded.dtype:
+            self._allocate(grid.shape, grid.dtype)
+
+        np.copyto(self.interior, grid)
+
+        return self
+
+    def window(self, position) -> np.ndarray:
+        """View of the neighborhood at `position`, shape (2N + 1, 2N + 1)."""
+        row, col = position
+        return self.views[..., row, col, :, :]
+
+    def windows(self, positions) -> np.ndarray:
+        """
+        Neighborhoods gathered with a single fancy-index operation.
+
+        For a single grid, the neighborhoods at each of the (K, 2) `positions`,
+        shape (K, 2N + 1, 2N + 1). For a batch of B grids, one (B, 2) position
+        per grid, shape (B, 2N + 1, 2N + 1).
+        """
+        positions = np.asarray(positions)
+        rows, cols = positions[..., 0], positions[..., 1]
+
+        if self.views.ndim == 4:
+            return self.views[rows, cols]
+
+        return self.views[np.arange(len(positions)), rows, cols]
+
+    def _allocate(self, shape, dtype):
+        *batch, nrows, ncols = shape
+        n, side = self.n, 2 * self.n + 1
+
+        self.shape = shape
+        self.padded = np.full(
+            (*batch, nrows + 2 * n, ncols + 2 * n), self.invariant, dtype=dtype
+        )
+        self.interior = self.padded[..., n : n + nrows, n : n + ncols]
+
+        # Shape (*batch, nrows, ncols, 2N + 1, 2N + 1)
+        self.views = sliding_window_view(self.padded, (side, side), axis=(-2, -1))
+
+
+def neighborhoods(
+    grid: np.ndarray, n: int, positions, invariant: Union[int, np.ndarray] = 0
+) -> np.ndarray:
+    """Gets the N Moore neighborhoods at many positions, see `PaddedGrid.windows`."""
+    return PaddedGrid(grid, n, invariant).windows(positions)
+
+
+# Depracated: Superseded by `moore_n` and `PaddedGrid`.
 def neighborhood_at(grid, pos, invariant=0):
     """
     Calculates the Moore's neighborhood of cell at target position 'pos'.
@@ -0,0 +1,247 @@
+"""
+Bit-packed grids of three state forest fire CAs,
+for grids of millions of cells whose updates are bound by memory bandwidth.
+
+A cell is 2 bits, one on the TREE plane and one on the FIRE plane,
+EMPTY cells are on none of them.
+Updates run on whole uint64 words, 64 cells at a time.
+"""
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+WORD = 64
+
+# Bits of a uniform integer for Bernoulli bits, probabilities are exact up to 2**-32
+PRECISION = 32
+
+_ONE = np.uint64(1)
+_LAST = np.uint64(WORD - 1)
+_ALL = np.uint64(2**WORD - 1)
+
+# Set bits of each byte value
+_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+class PackedGrid:
+    """
+    Grid of EMPTY, TREE and FIRE cells as two bit planes, `tree` and `fire`,
+    of shape (..., nrows, nwords), 64 cells by uint64 word.
+
+    The column `col` is the bit `col % 64` of the word `col // 64`,
+    bits past the last column are 0.
+    Leading dimensions are a batch of grids.
+
+        Example::
+
+            >>> packed = PackedGrid.pack(grid, empty=0, tree=3, fire=25)
+            >>> packed, context = ca(packed, None, context)
+            >>> obs = packed.unpack()
+
+    """
+
+    def __init__(
+        self,
+        tree: np.ndarray,
+        fire: np.ndarray,
+        ncols: int,
+        values: Tuple[int, int, int],
+        dtype=np.uint8,
+    ):
+        assert tree.shape == fire.shape, "Planes of different shapes"
+        assert tree.shape[-1] == -(-ncols // WORD), "Planes do not fit the columns"
+
+        self.tree = tree
+        self.fire = fire
+        self.ncols = ncols
+
+        # Bits of the columns by word, shape (nwords,)
+        self.valid = _valid_bits(ncols)
+
+        self.values = values  # (empty, tree, fire)
+        self.dtype = np.dtype(dtype)
+
+    @classmethod
+    def pack(cls, grid: np.ndarray, empty, tree, fire) -> "PackedGrid":
+        grid = np.asarray(grid)
+
+        is_tree = grid == tree
+        is_fire = grid == fire
+
+        if not np.all(is_tree | is_fire | (grid == empty)):
+            raise ValueError(f"Only cells of {(empty, tree, fire)} can be packed.")
+
+        return cls(
+            pack_bits(is_tree),
+            pack_bits(is_fire),
+            grid.shape[-1],
+            (empty, tree, fire),
+            grid.dtype,
+        )
+
+    def unpack(self) -> np.ndarray:
+        is_tree = unpack_bits(self.tree, self.ncols)
+        is_fire = unpack_bits(self.fire, self.ncols)
+
+        values = np.array(self.values, dtype=self.dtype)
+
+        return values[is_tree + 2 * is_fire]
+
+    def __array__(self, dtype=None, copy=None):
+        grid = self.unpack()
+        return grid if dtype is None else grid.astype(dtype, copy=False)
+
+    def replace(self, tree: np.ndarray, fire: np.ndarray) -> "PackedGrid":
+        """A grid of the same columns, values and dtype, with new planes."""
+        return PackedGrid(tree, fire, self.ncols, self.values, self.dtype)
+
+    def copy(self) -> "PackedGrid":
+        return self.replace(self.tree.copy(), self.fire.copy())
+
+    def count(self, value) -> int:
+        """Number of cells of `value`."""
+        empty, tree, fire = self.values
+
+        if value == tree:
+            return popcount(self.tree)
+
+        if value == fire:
+            return popcount(self.fire)
+
+        if value == empty:
+            return self.size - popcount(self.tree) - popcount(self.fire)
+
+        return 0
+
+    @property
+    def shape(self) -> tuple:
+        return (*self.tree.shape[:-1], self.ncols)
+
+    @property
+    def ndim(self) -> int:
+        return self.tree.ndim
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.tree.nbytes + self.fire.nbytes
+
+
+@lru_cache(maxsize=None)
+def _valid_bits(ncols: int) -> np.ndarray:
+    valid = pack_bits(np.ones(ncols, dtype=bool))
+
+    # Shared by the grids of `ncols` columns
+    valid.flags.writeable = False
+
+    return valid
+
+
+def pack_bits(mask: np.ndarray) -> np.ndarray:
+    """Booleans of shape (..., ncols) as uint64 words, shape (..., nwords)."""
+    *batch, ncols = mask.shape
+    nwords = -(-ncols // WORD)
+
+    packed = np.zeros((*batch, nwords * 8), dtype=np.uint8)
+    packed[..., : -(-ncols // 8)] = np.packbits(mask, axis=-1, bitorder="little")
+
+    return packed.view("<u8")
+
+
+def unpack_bits(plane: np.ndarray, ncols: int) -> np.ndarray:
+    """Inverse of `pack_bits`, as uint8 zeros and ones."""
+    bytes_ = np.ascontiguousarray(plane, dtype="<u8").view(np.uint8)
+    return np.unpackbits(bytes_, axis=-1, count=ncols, bitorder="little")
+
+
+def popcount(plane: np.ndarray) -> int:
+    bytes_ = np.ascontiguousarray(plane, dtype="<u8").view(np.uint8)
+    return int(_POPCOUNT[bytes_].sum(dtype=np.int64))
+
+
+def shift_columns(plane: np.ndarray, dc: int) -> np.ndarray:
+    """
+    Plane whose bit at column `col` is the bit at `col + dc` of `plane`,
+    for `dc` in (-1, 0, 1). Columns past the edges are 0,
+    but a bit may be carried past the last column, mask it if needed.
+    """
+    if dc == 0:
+        return plane
+
+    shifted = np.empty_like(plane)
+
+    if dc == 1:
+        # Bit b takes bit b + 1, the highest bit comes from the next word
+        np.right_shift(plane, _ONE, out=shifted)
+        shifted[..., :-1] |= plane[..., 1:] << _LAST
+
+    else:
+        # Bit b takes bit b - 1, the lowest bit comes from the previous word
+        np.left_shift(plane, _ONE, out=shifted)
+        shifted[..., 1:] |= plane[..., :-1] >> _LAST
+
+    return shifted
+
+
+def or_rows(out: np.ndarray, plane: np.ndarray, dr: int):
+    """out[..., row, :] |= plane[..., row + dr, :], rows past the edges are 0."""
+    if dr == 0:
+        out |= plane
+
+    elif dr == 1:
+        out[..., :-1, :] |= plane[..., 1:, :]
+
+    else:
+        out[..., 1:, :] |= plane[..., :-1, :]
+
+
+def bernoulli(np_random: np.random.Generator, shape: tuple, *probs) -> list:
+    """
+    A bit plane of `shape` by probability, bits are set with probability `p`.
+    Probabilities broadcast against `shape`, e.g. shape (..., 1, 1) for a batch.
+
+    Each cell draws a uniform integer of 32 bits, as 32 random planes,
+    and sets its bit if it is below `p * 2**32`.
+    Planes of all the probabilities are compared against the same draws,
+    starting from the lowest set bit of the probabilities.
+    """
+    thresholds = [
+        np.floor(np.clip(p, 0.0, 1.0) * 2.0**PRECISION).astype(np.uint64)
+        for p in probs
+    ]
+
+    # Bit masks of a threshold, all ones where the bit is set
+    def ones(threshold, bit):
+        return ((threshold >> np.uint64(bit)) & _ONE) * _ALL
+
+    set_bits = 0
+    for threshold in thresholds:
+        for bits in np.ravel(threshold).tolist():
+            set_bits |= bits
+
+    if set_bits == 0:
+        return [np.zeros(shape, dtype=np.uint64) for __ in probs]
+
+    # Lowest set bit, lower bits of the draws do not change the comparisons
+    lowest = (set_bits & -set_bits).bit_length() - 1
+
+    below = [np.zeros(shape, dtype=np.uint64) for __ in probs]
+
+    for bit in range(lowest, PRECISION):
+        unset = ~np_random.bit_generator.random_raw(shape)
+
+        for less, threshold in zip(below, thresholds):
+            mask = ones(threshold, bit)
+
+            # Equal bits defer to the lower bits
+            less[...] = (unset & (less | mask)) | (less & mask)
+
+    # Probability 1, the threshold is past the draws
+    for less, threshold in zip(below, thresholds):
+        less |= ones(threshold, PRECISION)
+
+    return below
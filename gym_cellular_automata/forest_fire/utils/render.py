@@ -1,3 +1,7 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+
 import numpy as np
 
 from gym_cellular_automata._config import PROJECT_PATH
@@ -6,6 +10,126 @@ EMOJIFONT = PROJECT_PATH / "fonts/OpenMoji-Black.ttf"
 TITLEFONT = PROJECT_PATH / "fonts/FrederickatheGreat-Regular.ttf"
 
 
+class Renderer(ABC):
+    """
+    Figure of an environment, built once.
+
+    Later renders only update the artists of the figure.
+    The figure is rebuilt if it was closed, e.g. by `plt.close("all")`.
+    """
+
+    def __init__(self, env):
+        self.env = env
+        self.fig = None
+
+    def render(self):
+        import matplotlib.pyplot as plt
+
+        if self.fig is None or not plt.fignum_exists(self.fig.number):
+            self.fig = self.build()
+        else:
+            # Current figure for pyplot consumers, e.g. `plt.savefig`
+            plt.figure(self.fig.number)
+
+        self.update()
+
+        return self.fig
+
+    @abstractmethod
+    def build(self):
+        """Creates the figure and its artists, returns the figure."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self):
+        """Updates the artists to the current state of the environment."""
+        raise NotImplementedError
+
+
+# Smallest side of an rgb_array frame, on pixels
+RGB_SIZE = 256
+COLOR_SPRITE = "#FFFFFF"  # White, as the markers of the human render
+
+
+class RGBRenderer:
+    """
+    Frames as (nrows * scale, ncols * scale, 3) uint8 arrays, without matplotlib.
+
+    Cells are colored through a palette lookup table, upscaled with `np.repeat`,
+    and the agent cell is stamped with a precomputed sprite mask.
+    """
+
+    def __init__(self, env, colors: dict, scale: Optional[int] = None):
+        self.env = env
+
+        self.palette = get_palette(colors)
+        self.sprite_color = get_palette({0: COLOR_SPRITE})[0]
+
+        self.scale = scale or max(1, RGB_SIZE // max(env.nrows, env.ncols))
+        self.sprite = get_sprite(self.scale)
+
+    def render(self):
+        s = self.scale
+
+        frame = self.palette[self.env.grid]
+
+        if s > 1:
+            frame = frame.repeat(s, axis=0).repeat(s, axis=1)
+
+        # Forest fire contexts carry the agent position second
+        row, col = self.env.context[1]
+        frame[row * s : (row + 1) * s, col * s : (col + 1) * s][
+            self.sprite
+        ] = self.sprite_color
+
+        return frame
+
+
+def get_palette(colors: dict) -> np.ndarray:
+    """Lookup table from cell value to RGB color, colors as hex strings."""
+    palette = np.zeros((max(colors) + 1, 3), dtype=np.uint8)
+
+    for cell, color in colors.items():
+        palette[cell] = tuple(bytes.fromhex(color.lstrip("#")))
+
+    return palette
+
+
+@lru_cache(maxsize=None)
+def get_sprite(scale: int) -> np.ndarray:
+    """Ring mask of an agent cell, the whole cell at small scales."""
+    if scale < 4:
+        sprite = np.ones((scale, scale), dtype=bool)
+
+    else:
+        center = (scale - 1) / 2
+        rows, cols = np.ogrid[:scale, :scale]
+        distance = np.hypot(rows - center, cols - center)
+
+        sprite = (0.25 * scale <= distance) & (distance <= 0.45 * scale)
+
+    # Shared between envs
+    sprite.flags.writeable = False
+
+    return sprite
+
+
+@lru_cache(maxsize=None)
+def get_font(path):
+    """Font properties from a font file, default font if it is missing."""
+    from matplotlib.font_manager import FontProperties
+
+    return FontProperties(fname=path) if path.exists() else FontProperties()
+
+
+@lru_cache(maxsize=None)
+def get_svg_marker(svg_path, valign=None):
+    """Parsing SVG paths is slow, markers are parsed once per process."""
+    marker = parse_svg_into_mpl(svg_path)
+
+    return marker if valign is None else align_marker(marker, valign=valign)
+
+
 def parse_svg_into_mpl(svg_path):
     from svgpath2mpl import parse_path
 
@@ -2,7 +2,12 @@ import numpy as np
 import pytest
 from gymnasium import spaces
 
-from gym_cellular_automata.forest_fire.utils.neighbors import moore_n, neighborhood_at
+from gym_cellular_automata.forest_fire.utils.neighbors import (
+    PaddedGrid,
+    moore_n,
+    neighborhood_at,
+    neighborhoods,
+)
 from gym_cellular_automata.grid_space import GridSpace
 
 ROW = 4
@@ -72,6 +77,38 @@ def test_moore_n(grid_space, position_space, n_space):
     assert np.all(g == expected)
 
 
+@pytest.mark.parametrize("n", range(MAX_N + 1))
+def test_neighborhoods(grid_space, n):
+    grid = grid_space.sample()
+    positions = [(row, col) for row in range(ROW) for col in range(COL)]
+
+    windows = neighborhoods(grid, n, positions, INVARIANT)
+
+    for window, position in zip(windows, positions):
+        assert np.all(window == moore_n(n, position, grid, INVARIANT))
+
+
+def test_padded_grid_windows_are_views(grid_space):
+    grid = grid_space.sample()
+    padded = PaddedGrid(grid, MAX_N, INVARIANT)
+
+    window = padded.window((0, 0))
+    assert np.shares_memory(window, padded.padded)
+
+    # Updates are seen through the same windows
+    padded.update(grid_space.sample())
+    assert np.all(window == moore_n(MAX_N, (0, 0), padded.interior, INVARIANT))
+
+    # A batch of grids, a position per grid
+    batch = np.stack([grid_space.sample() for __ in range(4)])
+    positions = [(0, 0), (ROW - 1, COL - 1), (1, 2), (3, 0)]
+
+    windows = PaddedGrid(batch, 1, INVARIANT).windows(positions)
+
+    for window, grid, position in zip(windows, batch, positions):
+        assert np.all(window == moore_n(1, position, grid, INVARIANT))
+
+
 def test_neighborhood_at(grid_space):
     empty, tree, fire = range(3)
 
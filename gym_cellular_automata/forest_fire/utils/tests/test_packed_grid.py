@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from gym_cellular_automata.forest_fire.utils.packed_grid import (
+    PackedGrid,
+    bernoulli,
+    or_rows,
+    pack_bits,
+    shift_columns,
+    unpack_bits,
+)
+from gym_cellular_automata.grid_space import GridSpace
+
+EMPTY, TREE, FIRE = 0, 3, 25
+
+# Columns below, on and over a word
+SHAPES = [(4, 3), (5, 64), (2, 6, 130)]
+
+
+@pytest.fixture(params=SHAPES)
+def grid(request):
+    return GridSpace(values=[EMPTY, TREE, FIRE], shape=request.param).sample()
+
+
+def test_pack_unpack(grid):
+    packed = PackedGrid.pack(grid, EMPTY, TREE, FIRE)
+
+    assert packed.shape == grid.shape
+    assert np.array_equal(packed.unpack(), grid)
+    assert np.array_equal(np.asarray(packed), grid)
+    assert packed.unpack().dtype == grid.dtype
+
+    for value in (EMPTY, TREE, FIRE):
+        assert packed.count(value) == np.count_nonzero(grid == value)
+
+    # 2 bits per cell, up to the padding of the last word
+    assert packed.nbytes == 2 * 8 * np.prod(grid.shape[:-1]) * -(-grid.shape[-1] // 64)
+
+
+def test_valid_bits_are_shared(grid):
+    packed = PackedGrid.pack(grid, EMPTY, TREE, FIRE)
+    replaced = packed.replace(packed.tree, packed.fire)
+
+    assert replaced.valid is packed.valid
+    assert not packed.valid.flags.writeable
+    assert np.array_equal(
+        unpack_bits(packed.valid, grid.shape[-1]), np.ones(grid.shape[-1])
+    )
+
+
+def test_pack_foreign_values():
+    with pytest.raises(ValueError):
+        PackedGrid.pack(np.array([[EMPTY, TREE, FIRE + 1]]), EMPTY, TREE, FIRE)
+
+
+@pytest.mark.parametrize("dr", [-1, 0, 1])
+@pytest.mark.parametrize("dc", [-1, 0, 1])
+def test_neighbor_shifts(dr, dc):
+    nrows, ncols = 6, 130
+    mask = np.random.random((nrows, ncols)) < 0.5
+
+    out = np.zeros((nrows, -(-ncols // 64)), dtype=np.uint64)
+    or_rows(out, shift_columns(pack_bits(mask), dc), dr)
+
+    # Neighbor at (dr, dc), zero past the edges
+    padded = np.pad(mask, 1)
+    expected = padded[1 + dr : 1 + dr + nrows, 1 + dc : 1 + dc + ncols]
+
+    assert np.array_equal(unpack_bits(out, ncols), expected)
+
+
+def test_bernoulli():
+    np_random = np.random.default_rng(0)
+    probs = [0.0, 0.033, 0.5, 0.9, 1.0]
+
+    planes = bernoulli(np_random, (256, 16), *probs)
+
+    for plane, p in zip(planes, probs):
+        assert np.isclose(unpack_bits(plane, 1024).mean(), p, atol=0.01)
+
+    # By batch
+    probs = np.array([0.1, 0.7])
+    (plane,) = bernoulli(np_random, (2, 256, 16), probs[:, None, None])
+
+    assert np.allclose(unpack_bits(plane, 1024).mean(axis=(1, 2)), probs, atol=0.01)
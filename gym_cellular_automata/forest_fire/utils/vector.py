@@ -0,0 +1,54 @@
+"""
+Batched counterparts of the Move and Modify operators.
+Positions are (N, 2) arrays and grids are (N, nrows, ncols) arrays.
+"""
+import numpy as np
+
+
+def get_directions(directions_sets: dict, nactions: int) -> np.ndarray:
+    """Row and column offsets per move action, as a (nactions, 2) array."""
+    sets = directions_sets
+    directions = np.zeros((nactions, 2), dtype=np.int64)
+
+    for action in range(nactions):
+        directions[action] = (
+            (action in sets["down"]) - (action in sets["up"]),
+            (action in sets["right"]) - (action in sets["left"]),
+        )
+
+    return directions
+
+
+def get_effects(effects: dict, ncells: int, dtype):
+    """Substitution effects and their presence, both indexed by cell value."""
+    substitutions = np.arange(ncells, dtype=dtype)
+    has_effect = np.zeros(ncells, dtype=bool)
+
+    for cell, effect in effects.items():
+        substitutions[cell] = effect
+        has_effect[cell] = True
+
+    return substitutions, has_effect
+
+
+def move(positions, actions, directions, grid_shape, where):
+    """Moves the positions in place, bounded by the grid."""
+    nrows, ncols = grid_shape
+
+    moved = positions + directions[actions]
+    np.clip(moved, 0, [nrows - 1, ncols - 1], out=moved)
+
+    positions[where] = moved[where]
+
+
+def modify(grids, positions, where, substitutions, has_effect):
+    """Applies the effects at the positions in place, returns the hits."""
+    envs = np.arange(len(grids))
+    rows, cols = positions[:, 0], positions[:, 1]
+
+    cells = grids[envs, rows, cols]
+    hits = where & has_effect[cells]
+
+    grids[envs[hits], rows[hits], cols[hits]] = substitutions[cells[hits]]
+
+    return hits
@@ -1,9 +1,20 @@
+from copy import deepcopy
 from functools import reduce
 from operator import mul
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence
 
 import numpy as np
-from gymnasium.spaces import Space
+from gymnasium.spaces import Box, Space, flatten
+from gymnasium.vector.utils import (
+    batch_space,
+    concatenate,
+    create_empty_array,
+    create_shared_memory,
+    iterate,
+    read_from_shared_memory,
+    write_to_shared_memory,
+)
+from numpy.typing import NDArray
 
 
 class GridSpace(Space):
@@ -18,6 +29,12 @@ class GridSpace(Space):
 
     """
 
+    # Wider ranges of cell values fall back to binary search
+    _MAX_LUT = 2**16
+
+    # More cell values are sampled by binary search
+    _MAX_THRESHOLDS = 16
+
     def __init__(
         self,
         n: Optional[int] = None,
@@ -37,6 +54,10 @@ class GridSpace(Space):
             self.values = np.unique(np.array(values, dtype=dtype))
             self.n = len(self.values)
 
+            assert np.array_equal(
+                self.values, np.unique(values)
+            ), f"Cell values do NOT FIT on {np.dtype(dtype)}."
+
         elif n is not None:
             self._from_values = False
 
@@ -57,16 +78,106 @@ class GridSpace(Space):
 
         self.size = reduce(mul, self.shape)
 
+        self._thresholds = self._get_thresholds()
+        self._lut_offset, self._lut = self._get_lut()
+
+        # Membership table by cell value, sharing the offset of `_lut`
+        self._membership = None if self._lut is None else self._lut >= 0
+        self._contiguous = int(self.values[-1]) - int(self.values[0]) == self.n - 1
+
     def sample(self) -> np.ndarray:
-        return self.np_random.choice(
-            a=self.values, size=self.size, p=self.probs
-        ).reshape(self.shape)
+        return self._sample(self.shape)
+
+    def sample_batch(self, n: int) -> np.ndarray:
+        """`n` independent samples stacked on a new leading axis."""
+        return self._sample((n, *self.shape))
+
+    def _sample(self, shape) -> np.ndarray:
+        # A single uniform draw per cell, thresholded on the cumulative probabilities
+        uniform = self.np_random.random(shape, dtype=np.float32)
+
+        if self.n > self._MAX_THRESHOLDS:
+            indices = np.searchsorted(self._thresholds, uniform, side="right")
+            return self.values.take(indices)
+
+        indices = np.zeros(shape, dtype=np.uint8)
+
+        for threshold in self._thresholds:
+            np.add(indices, uniform >= threshold, out=indices)
+
+        return self.values.take(indices)
 
     def contains(self, x) -> bool:
         if isinstance(x, list):
             x = np.array(x, dtype=self.dtype)
 
-        return set(np.unique(x)).issubset(set(self.values)) and self.shape == x.shape
+        x = np.asarray(x)
+
+        if self.shape != x.shape:
+            return False
+
+        if x.size == 0:
+            return True
+
+        # Out of range cells are caught by a cheap min/max pass
+        if x.min() < self.values[0] or x.max() > self.values[-1]:
+            return False
+
+        if self._contiguous and x.dtype.kind in "iu":
+            return True
+
+        return bool(self._members(x).all())
+
+    def contains_batch(self, x) -> np.ndarray:
+        """Whether each sample along the leading axis of `x` is in the space."""
+        x = np.asarray(x)
+
+        if self.shape != x.shape[1:]:
+            return np.zeros(len(x), dtype=bool)
+
+        return self._members(x).reshape(len(x), -1).all(axis=1)
+
+    def _members(self, x) -> np.ndarray:
+        """Cell-wise membership of `x` on `values`."""
+        if self._lut is None or x.dtype.kind not in "iu":
+            return np.isin(x, self.values)
+
+        shifted = np.subtract(x, self._lut_offset, dtype=np.intp)
+        return self._membership.take(shifted, mode="clip")
+
+    def value_indices(self, x) -> np.ndarray:
+        """Index of each cell of `x` on `values`, -1 for foreign cells."""
+        x = np.asarray(x)
+
+        if self._lut is not None:
+            shifted = np.subtract(x, self._lut_offset, dtype=np.intp)
+            return self._lut.take(shifted, mode="clip")
+
+        indices = np.searchsorted(self.values, x).clip(max=self.n - 1)
+        return np.where(self.values[indices] == x, indices, -1)
+
+    def _get_thresholds(self):
+        """
+        Upper bound of the cumulative probability of each value but the last.
+        Normalized so that no uniform draw overflows the table.
+        """
+        cumulative = np.cumsum(self.probs, dtype=np.float64)
+        return (cumulative[:-1] / cumulative[-1]).astype(np.float32)
+
+    def _get_lut(self):
+        """
+        Lookup table from cell value to index on `values`.
+        Foreign values at both ends of the table, for clipping.
+        """
+        low, high = int(self.values.min()) - 1, int(self.values.max()) + 1
+
+        if high - low > self._MAX_LUT:
+            return None, None
+
+        lut = np.full(high - low + 1, -1, dtype=np.intp)
+        lut[self.values.astype(np.intp) - low] = np.arange(self.n)
+
+        return low, lut
 
     def __repr__(self):
         if self._from_values:
@@ -86,3 +197,33 @@ class GridSpace(Space):
     def is_np_flattenable(self):
         """Checks whether this space can be flattened to a :class:`spaces.Box`."""
         return True
+
+
+# Gymnasium utilities dispatch on the space type.
+# Grids are plain arrays, as the samples of a Box,
+# so its handlers are reused, e.g. vector envs share (n, *shape) buffers.
+
+
+@flatten.register(GridSpace)
+def _flatten_grid_space(space: GridSpace, x: NDArray[Any]) -> NDArray[Any]:
+    return np.asarray(x, dtype=space.dtype).flatten()
+
+
+@batch_space.register(GridSpace)
+def _batch_grid_space(space: GridSpace, n: int = 1) -> GridSpace:
+    return GridSpace(
+        n=None if space._from_values else space.n,
+        values=space.values if space._from_values else None,
+        shape=(n, *space.shape),
+        probs=space.probs,
+        dtype=space.dtype,
+        seed=deepcopy(space.np_random),
+    )
+
+
+concatenate.register(GridSpace, concatenate.dispatch(Box))
+iterate.register(GridSpace, iterate.dispatch(Box))
+create_empty_array.register(GridSpace, create_empty_array.dispatch(Box))
+create_shared_memory.register(GridSpace, create_shared_memory.dispatch(Box))
+read_from_shared_memory.register(GridSpace, read_from_shared_memory.dispatch(Box))
+write_to_shared_memory.register(GridSpace, write_to_shared_memory.dispatch(Box))
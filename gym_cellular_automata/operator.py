@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from copy import copy
+from time import perf_counter
 from typing import Any, Optional, Tuple
 
 import numpy as np
@@ -17,6 +18,10 @@ class Operator(ABC):
 
     deterministic: Optional[bool] = None
 
+    # Cells changed by the last update as (flat indices, old values, new values)
+    # None when unknown, set it on `update` if it comes for free
+    diff: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
     @abstractmethod
     def __init__(
         self,
@@ -72,3 +77,105 @@ class Operator(ABC):
     def seed(self, seed=None):
         self.np_random, seed = seeding.np_random(seed)
         return [seed]
+
+    def get_rng_state(self) -> Any:
+        """State of `np_random`, override it if the operator buffers random draws."""
+        return self.np_random.bit_generator.state
+
+    def set_rng_state(self, state: Any):
+        self.np_random.bit_generator.state = state
+
+
+def no_diff():
+    """Diff of an update that changed no cells."""
+    return (
+        np.empty(0, dtype=np.intp),
+        np.empty(0, dtype=np.int64),
+        np.empty(0, dtype=np.int64),
+    )
+
+
+def chain_diffs(*diffs):
+    """Diff of consecutive updates, None if any of them is unknown."""
+    if any(diff is None for diff in diffs):
+        return None
+
+    if len(diffs) == 1:
+        return diffs[0]
+
+    return tuple(np.concatenate(parts) for parts in zip(*diffs))
+
+
+def get_operators(operator):
+    """The operator and all of its suboperators, depth first."""
+    yield operator
+
+    for suboperator in operator.suboperators:
+        yield from get_operators(suboperator)
+
+
+def get_named_operators(operator, prefix=""):
+    """(path, operator) of the operator and its suboperators, depth first."""
+    path = prefix + type(operator).__name__
+    yield path, operator
+
+    for suboperator in operator.suboperators:
+        yield from get_named_operators(suboperator, path + "/")
+
+
+class Timed:
+    """
+    Wraps `function`, adding its calls and wall times to `timing`.
+    Unlike a closure, copies of bound methods are bound to the copied instance.
+    """
+
+    def __init__(self, function, timing: dict):
+        self.function = function
+        self.timing = timing
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter()
+
+        try:
+            return self.function(*args, **kwargs)
+
+        finally:
+            elapsed = perf_counter() - start
+
+            timing = self.timing
+            timing["calls"] += 1
+            timing["total"] += elapsed
+            timing["last"] = elapsed
+
+
+def new_timing():
+    return {"calls": 0, "total": 0.0, "last": 0.0}
+
+
+def start_timing(operator) -> dict:
+    """
+    Times the updates of the operator and its suboperators,
+    returns their timings by path, e.g. "MDP/RepeatCA/WindyForestFire".
+
+    Timed updates are set on the instances,
+    untimed operators run the class `update` with no overhead.
+    Times of an operator include those of its suboperators.
+    """
+    timings = {}
+    seen = set()
+
+    for path, op in get_named_operators(operator):
+        # Operators shared by several parents are timed once
+        if id(op) in seen:
+            continue
+        seen.add(id(op))
+
+        timings[path] = new_timing()
+        op.update = Timed(type(op).update.__get__(op), timings[path])
+
+    return timings
+
+
+def stop_timing(operator):
+    for op in get_operators(operator):
+        op.__dict__.pop("update", None)
@@ -0,0 +1,97 @@
+from bisect import bisect_right
+from copy import deepcopy
+from typing import Optional
+
+import gymnasium as gym
+
+
+class TrajectoryRecorder(gym.Wrapper):
+    """
+    Records the rollouts of a CAEnv as the seeds and actions of its episodes.
+
+    Any step of an episode is reconstructed by re-simulation on a clone,
+    from the seed of the episode or from the closest keyframe
+    (a full snapshot of the env), taken every `keyframe_every` steps.
+    Episodes reset without a seed also keep a keyframe of their first step.
+
+        Example::
+
+            >>> env = TrajectoryRecorder(gym.make("ForestFireBulldozer256x256-v3"))
+            >>> env.reset(seed=42)
+            >>> for __ in range(100):
+            ...     env.step(env.action_space.sample())
+            >>> grid, context = env.replay(64)
+
+    """
+
+    def __init__(self, env: gym.Env, keyframe_every: Optional[int] = 64):
+        super().__init__(env)
+
+        assert keyframe_every is None or keyframe_every > 0
+
+        self.keyframe_every = keyframe_every
+        self.episodes = []
+
+        # Replays run on a clone of the env
+        self._sim = env.unwrapped.clone()
+
+    def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
+        obs, info = self.env.reset(seed=seed, options=options)
+
+        self.episodes.append(
+            {
+                "seed": seed,
+                "options": deepcopy(options),
+                "actions": [],
+                "keyframes": {},
+            }
+        )
+
+        # Without a seed the initial state depends on the previous episodes
+        if seed is None:
+            self._keyframe()
+
+        return obs, info
+
+    def step(self, action):
+        assert self.episodes, "Call reset before step."
+
+        episode = self.episodes[-1]
+        episode["actions"].append(deepcopy(action))
+
+        step_tuple = self.env.step(action)
+
+        every = self.keyframe_every
+        if every is not None and len(episode["actions"]) % every == 0:
+            self._keyframe()
+
+        return step_tuple
+
+    def replay(self, step: int, episode: int = -1):
+        """
+        Reconstructs the (grid, context) after `step` actions of an episode.
+        """
+        record = self.episodes[episode]
+        actions, keyframes = record["actions"], record["keyframes"]
+
+        assert 0 <= step <= len(actions), f"Step {step} is not on the episode."
+
+        steps = sorted(keyframes)
+        index = bisect_right(steps, step) - 1
+
+        if index < 0:
+            start = 0
+            self._sim.reset(seed=record["seed"], options=record["options"])
+
+        else:
+            start = steps[index]
+            self._sim.set_state(keyframes[start])
+
+        for action in actions[start:step]:
+            self._sim.step(action)
+
+        return self._sim.grid.copy(), deepcopy(self._sim.context)
+
+    def _keyframe(self):
+        episode = self.episodes[-1]
+        episode["keyframes"][len(episode["actions"])] = self.env.unwrapped.get_state()
@@ -1,55 +1,117 @@
-from typing import Any
+"""
+Environments are registered by entry point strings,
+their modules are only imported on the first `gym.make`.
 
-from gymnasium.envs.registration import register
-from gymnasium.spaces import flatten
-from numpy.typing import NDArray
+Ids are parametric on the grid size, `ForestFireBulldozer{R}x{C}-v3`.
+The default sizes are registered on import,
+any other size is registered on demand by `make`, `make_vec` or `register_grid`.
+"""
+import re
 
-from gym_cellular_automata.forest_fire.bulldozer import ForestFireBulldozerEnv
-from gym_cellular_automata.forest_fire.helicopter import ForestFireHelicopterEnv
-from gym_cellular_automata.grid_space import GridSpace
+import gymnasium as gym
+from gymnasium.envs.registration import load_env_creator, register, registry
+from gymnasium.error import Error as GymError
 
 FFDIR = "gym_cellular_automata.forest_fire"
 
 
 LIBRARY = "gym_cellular_automata"
 
-prototypes = (ForestFireHelicopterEnv, ForestFireBulldozerEnv)
+# Grid size agnostic parameters, by env name
+CA_ENVS = {
+    "ForestFireHelicopter": {
+        "version": 1,
+        "entry_point": FFDIR + ".helicopter:ForestFireHelicopterEnv",
+        "vector_entry_point": FFDIR + ".helicopter:ForestFireHelicopterVectorEnv",
+    },
+    "ForestFireBulldozer": {
+        "version": 3,
+        "entry_point": FFDIR + ".bulldozer:ForestFireBulldozerEnv",
+        "vector_entry_point": FFDIR + ".bulldozer:ForestFireBulldozerVectorEnv",
+    },
+}
+
+# [module:]{name}{R}x{C}-v{version}
+ENV_ID = re.compile(
+    r"^(?:[\w.]+:)?(?P<name>[A-Za-z]+)(?P<nrows>\d+)x(?P<ncols>\d+)-v(?P<version>\d+)$"
+)
 
 
 HELR, HELC = 5, 5
 BULR, BULC = 256, 256
 
+
+def get_env_id(name: str, nrows: int, ncols: int) -> str:
+    return f"{name}{nrows}x{ncols}-v{CA_ENVS[name]['version']}"
+
+
+def get_spec_kwargs(env_id: str) -> dict:
+    """Registration of a parametric id, e.g. ForestFireBulldozer1024x512-v3."""
+    match = ENV_ID.match(env_id)
+
+    if match is None or match["name"] not in CA_ENVS:
+        raise GymError(
+            f"'{env_id}' is not a {LIBRARY} id, expected {{name}}{{R}}x{{C}}-v{{version}} "
+            f"with a name of {tuple(CA_ENVS)}."
+        )
+
+    params = CA_ENVS[match["name"]]
+
+    if int(match["version"]) != params["version"]:
+        raise GymError(
+            f"'{env_id}' has version v{match['version']}, "
+            f"{match['name']} is at v{params['version']}."
+        )
+
+    nrows, ncols = int(match["nrows"]), int(match["ncols"])
+
+    return {
+        "id": get_env_id(match["name"], nrows, ncols),
+        "kwargs": {"nrows": nrows, "ncols": ncols},
+        "entry_point": params["entry_point"],
+        "vector_entry_point": params["vector_entry_point"],
+    }
+
+
 REGISTERED_CA_ENVS = {
-    "ForestFireHelicopter"
-    + str(HELR)
-    + "x"
-    + str(HELC)
-    + "-v1": {
-        "kwargs": {"nrows": HELR, "ncols": HELC},
-        "entry_point": FFDIR + ".helicopter:ForestFireHelicopterEnv",
-    },
-    "ForestFireBulldozer"
-    + str(BULR)
-    + "x"
-    + str(BULC)
-    + "-v3": {
-        "kwargs": {"nrows": BULR, "ncols": BULC},
-        "entry_point": FFDIR + ".bulldozer:ForestFireBulldozerEnv",
-    },
+    spec["id"]: spec
+    for spec in (
+        get_spec_kwargs(get_env_id("ForestFireHelicopter", HELR, HELC)),
+        get_spec_kwargs(get_env_id("ForestFireBulldozer", BULR, BULC)),
+    )
 }
 
 GYM_MAKE = tuple(LIBRARY + ":" + ca_env for ca_env in REGISTERED_CA_ENVS)
 
 
+def register_grid(env_id: str) -> str:
+    """Registers a parametric id if needed, returns it without the library prefix."""
+    spec = get_spec_kwargs(env_id)
+
+    if spec["id"] not in registry:
+        register(**spec)
+
+    return spec["id"]
+
+
+def make(env_id: str, **kwargs) -> gym.Env:
+    """`gym.make` of any grid size, e.g. make("ForestFireBulldozer1024x1024-v3")."""
+    return gym.make(register_grid(env_id), **kwargs)
+
+
+def make_vec(env_id: str, num_envs: int = 1, **kwargs) -> gym.vector.VectorEnv:
+    """`gym.make_vec` of any grid size."""
+    return gym.make_vec(register_grid(env_id), num_envs=num_envs, **kwargs)
+
+
 def _register_caenvs():
     for ca_env in REGISTERED_CA_ENVS:
-        register(
-            ca_env,
-            kwargs=REGISTERED_CA_ENVS[ca_env]["kwargs"],
-            entry_point=REGISTERED_CA_ENVS[ca_env]["entry_point"],
-        )
+        register(**REGISTERED_CA_ENVS[ca_env])
+
 
+def __getattr__(name):
+    # Env classes are imported on first access
+    if name == "prototypes":
+        return tuple(load_env_creator(spec["entry_point"]) for spec in CA_ENVS.values())
 
-@flatten.register(GridSpace)
-def _flatten_grid_space(space: GridSpace, x: NDArray[Any]) -> NDArray[Any]:
-    return np.asarray(x, dtype=space.dtype).flatten()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
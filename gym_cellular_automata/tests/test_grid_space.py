@@ -69,3 +69,104 @@ def test_seed():
     grid2 = space2.sample()
 
     assert np.all(grid1 == grid2), f"Not equal with SEED {SEED}"
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        GridSpace(values=[-1, 0, 1], shape=(4, 4)),
+        GridSpace(values=[0, 3, 25], shape=(4, 4), dtype=np.uint8),
+        GridSpace(values=[-(2**20), 0, 2**20], shape=(4, 4)),
+    ],
+)
+def test_value_indices(space):
+    grid = space.sample()
+    indices = space.value_indices(grid)
+
+    assert np.all(space.values[indices] == grid)
+
+    foreign = np.array([space.values.max() + 1, space.values.min() - 1])
+    assert np.all(space.value_indices(foreign) == -1)
+
+
+def test_values_must_fit_dtype():
+    with pytest.raises(AssertionError):
+        GridSpace(values=[0, 1, 256], shape=(2, 2), dtype=np.uint8)
+
+
+def test_sample_batch():
+    space = GridSpace(values=[0, 3, 25], probs=[0.1, 0.9, 0.0], shape=(8, 16))
+    batch = space.sample_batch(32)
+
+    assert batch.shape == (32, 8, 16)
+    assert batch.dtype == space.dtype
+    assert all(space.contains(sample) for sample in batch)
+
+    # Values without probability are never sampled
+    assert not np.any(batch == 25)
+
+
+@pytest.mark.parametrize(
+    "space, foreign",
+    [
+        (GridSpace(n=3, shape=(4, 4)), [-1, 3]),
+        (GridSpace(values=[0, 3, 25], shape=(4, 4), dtype=np.uint8), [4, 26]),
+        (GridSpace(values=[-(2**20), 0, 2**20], shape=(4, 4)), [1, 2**21]),
+    ],
+)
+def test_contains_batch(space, foreign):
+    batch = space.sample_batch(8)
+    assert np.all(space.contains_batch(batch))
+
+    batch[3, 1, 2], batch[5, 0, 0] = foreign
+
+    expected = np.ones(8, dtype=bool)
+    expected[[3, 5]] = False
+
+    assert np.all(space.contains_batch(batch) == expected)
+    assert all(space.contains(sample) == e for sample, e in zip(batch, expected))
+
+    assert not np.any(space.contains_batch(batch[:, :2]))
+
+
+def test_vector_utils():
+    import multiprocessing as mp
+
+    from gymnasium.spaces import Discrete, Tuple
+    from gymnasium.vector.utils import (
+        batch_space,
+        concatenate,
+        create_empty_array,
+        create_shared_memory,
+        iterate,
+        read_from_shared_memory,
+        write_to_shared_memory,
+    )
+
+    n = 3
+    space = GridSpace(values=[0, 3, 25], shape=(4, 5), dtype=np.uint8)
+    space.seed(0)
+
+    batched = batch_space(space, n)
+    assert batched == GridSpace(values=[0, 3, 25], shape=(n, 4, 5))
+    assert batched.dtype == space.dtype
+
+    grids = [space.sample() for __ in range(n)]
+
+    out = create_empty_array(space, n)
+    assert out.shape == (n, 4, 5) and out.dtype == space.dtype
+
+    out = concatenate(space, grids, out)
+    assert batched.contains(out)
+    assert all(np.array_equal(g1, g2) for g1, g2 in zip(iterate(batched, out), grids))
+
+    # As observations of async vector envs
+    obs_space = Tuple((space, Discrete(2)))
+    shared = create_shared_memory(obs_space, n, ctx=mp)
+
+    for i, grid in enumerate(grids):
+        write_to_shared_memory(obs_space, i, (grid, 1), shared)
+
+    obs = read_from_shared_memory(obs_space, shared, n)
+    assert np.array_equal(obs[0], out)
+    assert obs[0].dtype == space.dtype
@@ -21,3 +21,49 @@ def test_gymca():
             env = ProtoEnv(*rc)
             env.reset()
             assert isinstance(env, gym.Env)
+
+
+IMPORT_BUDGET = 0.25  # Seconds, on top of numpy and gymnasium
+
+
+def test_import_is_light():
+    import subprocess
+    import sys
+
+    from gym_cellular_automata._config import PROJECT_PATH
+
+    script = """
+import sys
+import time
+
+import gymnasium
+import numpy
+
+start = time.perf_counter()
+import gym_cellular_automata as gymca
+
+elapsed = time.perf_counter() - start
+
+# Envs are only imported on first use
+assert not [name for name in sys.modules if "forest_fire" in name]
+
+env = gymca.prototypes[1](16, 16)
+env.reset(seed=0)
+env.step(env.action_space.sample())
+
+heavy = [name for name in ("matplotlib", "scipy", "svgpath2mpl") if name in sys.modules]
+print(elapsed, *heavy)
+"""
+    # A fresh interpreter, as the tests already imported everything
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    elapsed, heavy = float(output[0]), output[1:]
+
+    assert not heavy, f"Imported on a plain rollout: {heavy}"
+    assert elapsed < IMPORT_BUDGET, f"Import took {elapsed:.3f}s"
@@ -6,6 +6,33 @@ def test_operator():
     assert_operator(Identity(), strict=False)
 
 
+def test_timing():
+    import numpy as np
+
+    from gym_cellular_automata.operator import start_timing, stop_timing
+
+    parent, child = Identity(), Identity()
+    parent.suboperators = (child,)
+
+    timings = start_timing(parent)
+    assert set(timings) == {"Identity", "Identity/Identity"}
+
+    grid = np.zeros((3, 3))
+    parent(grid, None, None)
+    parent(grid, None, None)
+    child(grid, None, None)
+
+    assert timings["Identity"]["calls"] == 2
+    assert timings["Identity/Identity"]["calls"] == 1
+    assert timings["Identity"]["total"] >= timings["Identity"]["last"] > 0.0
+
+    stop_timing(parent)
+    assert "update" not in vars(parent) and "update" not in vars(child)
+
+    parent(grid, None, None)
+    assert timings["Identity"]["calls"] == 2
+
+
 def assert_operator(op, strict=False):
     from gymnasium.spaces import Space
 
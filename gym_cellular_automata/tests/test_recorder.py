@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from gym_cellular_automata.forest_fire.bulldozer import ForestFireBulldozerEnv
+from gym_cellular_automata.forest_fire.helicopter import ForestFireHelicopterEnv
+from gym_cellular_automata.recorder import TrajectoryRecorder
+
+STEPS = 48
+KEYFRAME_EVERY = 16
+
+
+ENVS = [
+    lambda: ForestFireBulldozerEnv(nrows=64, ncols=64),
+    lambda: ForestFireHelicopterEnv(nrows=8, ncols=8),
+]
+
+
+@pytest.fixture(params=ENVS)
+def env(request):
+    return TrajectoryRecorder(request.param(), keyframe_every=KEYFRAME_EVERY)
+
+
+def test_replay_matches_rollout(env):
+    obs, info = env.reset(seed=7)
+    grids = [obs[0].copy()]
+
+    for step in range(STEPS):
+        obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+        grids.append(obs[0].copy())
+
+        if terminated:
+            break
+
+    # Seeded episodes start from their seed
+    episode = env.episodes[-1]
+    assert sorted(episode["keyframes"]) == list(
+        range(KEYFRAME_EVERY, step + 2, KEYFRAME_EVERY)
+    )
+
+    for step in (0, 1, KEYFRAME_EVERY - 1, KEYFRAME_EVERY + 3, len(grids) - 1):
+        grid, context = env.replay(step)
+        assert np.all(grid == grids[step])
+
+    # Replays leave the recorded env untouched
+    assert np.all(env.unwrapped.grid == grids[-1])
+
+
+def test_replay_previous_episodes(env):
+    finals = []
+
+    for seed in range(2):
+        env.reset(seed=seed)
+
+        for step in range(KEYFRAME_EVERY // 2):
+            obs, *__ = env.step(env.action_space.sample())
+
+        finals.append(obs[0].copy())
+
+    for episode, final in enumerate(finals):
+        grid, context = env.replay(KEYFRAME_EVERY // 2, episode=episode)
+        assert np.all(grid == final)
+
+
+@pytest.mark.parametrize("make_env", ENVS)
+def test_replay_from_seeds_alone(make_env):
+    env = TrajectoryRecorder(make_env(), keyframe_every=None)
+
+    finals = []
+
+    # Episodes of the same seed, after different episodes
+    for seed in (3, 5, 3):
+        env.reset(seed=seed)
+        env.action_space.seed(seed)
+
+        for step in range(KEYFRAME_EVERY):
+            obs, reward, terminated, *__ = env.step(env.action_space.sample())
+
+            if terminated:
+                break
+
+        finals.append((step + 1, obs[0].copy()))
+
+    assert not any(episode["keyframes"] for episode in env.episodes)
+    assert np.all(finals[0][1] == finals[2][1])
+
+    for episode, (steps, final) in enumerate(finals):
+        grid, context = env.replay(steps, episode=episode)
+        assert np.all(grid == final)
+
+
+def test_replay_unseeded_episodes(env):
+    env.reset(seed=0)
+
+    # The initial state depends on the previous episode
+    obs, info = env.reset()
+    grids = [obs[0].copy()]
+
+    for step in range(KEYFRAME_EVERY // 2):
+        obs, *__ = env.step(env.action_space.sample())
+        grids.append(obs[0].copy())
+
+    assert 0 in env.episodes[-1]["keyframes"]
+
+    for step, expected in enumerate(grids):
+        grid, context = env.replay(step)
+        assert np.all(grid == expected)
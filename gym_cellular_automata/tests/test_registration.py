@@ -79,3 +79,23 @@ def assert_gym_api(envs, resets, steps, plot_each):
                 assert isinstance(info, dict)
 
         env.close()
+
+
+def test_parametric_ids():
+    import gym_cellular_automata as gymca
+    from gym_cellular_automata.registration import register_grid
+
+    env = gymca.make("gym_cellular_automata:ForestFireBulldozer48x80-v3")
+    assert env.unwrapped.grid_space.shape == (48, 80)
+    assert env.spec.id == "ForestFireBulldozer48x80-v3"
+
+    # Registered ids are also available to gym.make
+    assert register_grid("ForestFireHelicopter7x9-v1") == "ForestFireHelicopter7x9-v1"
+    assert gym.make("ForestFireHelicopter7x9-v1").unwrapped.nrows == 7
+
+    envs = gymca.make_vec("ForestFireHelicopter7x9-v1", num_envs=3)
+    assert envs.num_envs == 3
+
+    for bad_id in ("ForestFireBulldozer48x80-v2", "Unknown48x80-v1", "ForestFire-v1"):
+        with pytest.raises(gym.error.Error):
+            gymca.make(bad_id)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from gym_cellular_automata.tiled_grid import TiledGrid
+
+SHAPE = 100, 130  # Not a multiple of the tile
+TILE = 32, 32
+
+
+@pytest.fixture
+def grid():
+    return np.random.default_rng(0).integers(0, 3, size=SHAPE, dtype=np.uint8)
+
+
+def test_round_trip(grid):
+    tiled = TiledGrid(grid, tile=TILE)
+
+    assert np.array_equal(tiled.to_array(), grid)
+    assert np.array_equal(np.asarray(tiled), grid)
+    assert tiled.nbytes == grid.nbytes
+
+    # Snapshots do not alias the grid
+    grid[0, 0] += 1
+    assert tiled.to_array()[0, 0] != grid[0, 0]
+
+
+def test_only_changed_tiles_are_copied(grid):
+    root = TiledGrid(grid, tile=TILE)
+
+    grid[5, 5] += 1
+    grid[70, 120] += 1
+    child = TiledGrid(grid, base=root)
+
+    changed = {(0, 0), (64, 96)}
+
+    for key, tile in child.tiles.items():
+        assert (tile is root.tiles[key]) == (key not in changed)
+        assert not tile.flags.writeable
+
+    copied = sum(child.tiles[key].nbytes for key in changed)
+    assert child.nbytes_shared(root) == grid.nbytes - copied
+    assert np.array_equal(child.to_array(), grid)
+
+
+def test_dense_base(grid):
+    base = grid.copy()
+    base.flags.writeable = False
+
+    grid[-1, -1] += 1
+    child = TiledGrid(grid, base=base, tile=TILE)
+
+    assert child.nbytes_shared(base) == grid.nbytes - child.tiles[(96, 128)].nbytes
+    assert np.array_equal(child.to_array(), grid)
+
+    with pytest.raises(AssertionError):
+        TiledGrid(grid, base=grid)
@@ -0,0 +1,95 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from gym_cellular_automata.forest_fire.bulldozer import ForestFireBulldozerEnv
+from gym_cellular_automata.forest_fire.helicopter import ForestFireHelicopterEnv
+from gym_cellular_automata.trajectory import TrajectoryReader, TrajectoryWriter
+
+EPISODES = 3
+STEPS = 40
+KEYFRAME_EVERY = 16
+
+
+@pytest.fixture(
+    params=[
+        lambda: ForestFireBulldozerEnv(nrows=64, ncols=64),
+        lambda: ForestFireHelicopterEnv(nrows=8, ncols=8),
+    ]
+)
+def env(request):
+    return request.param()
+
+
+def rollout(env, writer, seed, use_diff=False):
+    obs, info = env.reset(seed=seed)
+    writer.reset(obs)
+
+    observations = [deepcopy(obs)]
+    actions, rewards = [], []
+
+    for step in range(STEPS):
+        action = env.action_space.sample()
+        obs, reward, terminated, truncated, info = env.step(action)
+        # Changed cells known by the MDP, if any
+        diff = env.MDP.diff if use_diff else None
+        writer.step(obs, action, reward, terminated, diff)
+
+        observations.append(deepcopy(obs))
+        actions.append(action)
+        rewards.append(reward)
+
+        if terminated:
+            break
+
+    return observations, actions, rewards
+
+
+@pytest.mark.parametrize("use_diff", [False, True])
+def test_trajectory_roundtrip(env, tmp_path, use_diff):
+    episodes = []
+
+    with TrajectoryWriter(
+        tmp_path, env.observation_space, env.action_space, KEYFRAME_EVERY
+    ) as writer:
+        for seed in range(EPISODES - 1):
+            episodes.append(rollout(env, writer, seed, use_diff))
+
+    # Files are appended on new sessions
+    with TrajectoryWriter(
+        tmp_path, env.observation_space, env.action_space, KEYFRAME_EVERY
+    ) as writer:
+        episodes.append(rollout(env, writer, EPISODES, use_diff))
+
+    reader = TrajectoryReader(tmp_path)
+    assert len(reader) == sum(len(obs) for obs, *__ in episodes)
+
+    for episode, (observations, actions, rewards) in enumerate(episodes):
+        rows = reader.episode_rows(episode)
+        assert len(rows) == len(observations)
+
+        grids = reader.grids(rows)
+
+        for row, grid, (expected_grid, expected_context) in zip(
+            rows, grids, observations
+        ):
+            assert np.all(grid == expected_grid)
+            assert np.all(reader.grid(row) == expected_grid)
+
+            for part, expected in zip(reader.context(row), expected_context):
+                assert np.allclose(part, expected)
+
+        assert np.allclose(reader.rewards[rows.start + 1 : rows.stop], rewards)
+        assert np.allclose(
+            reader.actions[rows.start + 1 : rows.stop],
+            np.reshape(actions, (len(actions), -1)),
+        )
+
+
+def test_step_before_reset(env, tmp_path):
+    with TrajectoryWriter(tmp_path, env.observation_space, env.action_space) as writer:
+        obs, info = env.reset()
+
+        with pytest.raises(AssertionError):
+            writer.step(obs, env.action_space.sample())
@@ -0,0 +1,103 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+
+class TiledGrid:
+    """
+    Immutable grid stored as read-only tiles, shared with a base grid.
+
+    Only the tiles that differ from the base are copied,
+    so a tree of branching snapshots grows with the changes of each branch,
+    not with the size of the grid.
+    The base is either a TiledGrid or a read-only array,
+    whose tiles are then kept as views.
+
+        Example::
+
+            >>> root = env.get_state()
+            >>> env.step(action)
+            >>> child = TiledGrid(env.grid, base=root.grid)
+            >>> child.nbytes_shared(root.grid)
+
+    """
+
+    def __init__(
+        self,
+        grid: np.ndarray,
+        base: Optional[Union["TiledGrid", np.ndarray]] = None,
+        tile: Tuple[int, int] = (64, 64),
+    ):
+        grid = np.asarray(grid)
+
+        if isinstance(base, TiledGrid):
+            tile = base.tile
+
+        self.shape = grid.shape
+        self.dtype = grid.dtype
+        self.tile = tile
+
+        if base is None:
+            base_tiles = {}
+
+        elif isinstance(base, TiledGrid):
+            base_tiles = base.tiles
+
+        else:
+            assert not base.flags.writeable, "Dense bases must be read-only."
+            base_tiles = dict(self._windows(base))
+
+        if base is not None:
+            assert base.shape == grid.shape, "Base grid of another shape."
+            assert base.dtype == grid.dtype, "Base grid of another dtype."
+
+        self.tiles = {}
+
+        for key, window in self._windows(grid):
+            shared = base_tiles.get(key)
+
+            if shared is not None and np.array_equal(shared, window):
+                self.tiles[key] = shared
+
+            else:
+                # Copy on write, only the changed tiles
+                self.tiles[key] = window.copy()
+                self.tiles[key].flags.writeable = False
+
+    def __array__(self, dtype=None, copy=None):
+        grid = np.empty(self.shape, dtype=self.dtype)
+
+        for (row, col), tile in self.tiles.items():
+            nrows, ncols = tile.shape
+            grid[row : row + nrows, col : col + ncols] = tile
+
+        return grid if dtype is None else grid.astype(dtype, copy=False)
+
+    def to_array(self) -> np.ndarray:
+        """A new writeable grid."""
+        return self.__array__()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(tile.nbytes for tile in self.tiles.values())
+
+    def nbytes_shared(self, base: Union["TiledGrid", np.ndarray]) -> int:
+        """Bytes of the tiles shared with `base`."""
+        if isinstance(base, TiledGrid):
+            return sum(
+                tile.nbytes
+                for key, tile in self.tiles.items()
+                if tile is base.tiles.get(key)
+            )
+
+        return sum(
+            tile.nbytes for tile in self.tiles.values() if np.shares_memory(tile, base)
+        )
+
+    def _windows(self, grid):
+        nrows, ncols = self.shape
+        trows, tcols = self.tile
+
+        for row in range(0, nrows, trows):
+            for col in range(0, ncols, tcols):
+                yield (row, col), grid[row : row + trows, col : col + tcols]
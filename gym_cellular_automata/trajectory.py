@@ -0,0 +1,310 @@
+"""
+On-disk trajectories of CAEnv rollouts.
+
+A trajectory is a folder of append-only binary files,
+read back through `np.memmap`:
+
+    meta.json          grid and context layouts
+    steps.bin          a record per observation, see `STEP`
+    keyframes.bin      full grids, on resets and every `keyframe_every` steps
+    diff_indices.bin   flat indices of the cells changed on each step
+    diff_values.bin    new values of the cells changed on each step
+    contexts.bin       flattened context per observation
+    actions.bin        flattened action leading to each observation
+
+The grid of a step is materialized from its keyframe
+by applying the diffs of the following steps.
+"""
+import json
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from gymnasium import spaces
+
+# fmt: off
+STEP = np.dtype([
+    ("episode",    np.int64),    # Episode of the observation
+    ("step",       np.int64),    # Steps since reset
+    ("keyframe",   np.int64),    # Keyframe to start from
+    ("base",       np.int64),    # Diffs offset of that keyframe
+    ("diff_stop",  np.int64),    # Diffs offset after this step
+    ("reward",     np.float64),
+    ("terminated", np.bool_),
+])
+# fmt: on
+
+TYPE_INDEX = np.int32  # Flat cell indices
+TYPE_FLAT = np.float64  # Flattened contexts and actions
+
+FILES = ("steps", "keyframes", "diff_indices", "diff_values", "contexts", "actions")
+
+
+class TrajectoryWriter:
+    """
+    Appends the observations of CAEnv rollouts to a trajectory folder.
+
+        Example::
+
+            >>> with TrajectoryWriter(path, env.observation_space, env.action_space) as writer:
+            ...     obs, info = env.reset()
+            ...     writer.reset(obs)
+            ...     obs, reward, terminated, truncated, info = env.step(action)
+            ...     writer.step(obs, action, reward, terminated, env.unwrapped.MDP.diff)
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        observation_space: spaces.Tuple,
+        action_space: spaces.Space,
+        keyframe_every: int = 64,
+    ):
+        assert keyframe_every > 0, "'keyframe_every' must be a positive integer."
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        grid_space, context_space = observation_space
+
+        assert grid_space.size < np.iinfo(TYPE_INDEX).max, "Grid too large."
+
+        meta = {
+            "grid_shape": list(grid_space.shape),
+            "grid_dtype": np.dtype(grid_space.dtype).str,
+            "context_shapes": [list(space.shape) for space in context_space],
+            "context_dtypes": [np.dtype(space.dtype).str for space in context_space],
+            "action_size": int(np.prod(action_space.shape, dtype=int)),
+            "keyframe_every": keyframe_every,
+        }
+
+        meta_path = self.path / "meta.json"
+
+        if meta_path.exists():
+            stored = json.loads(meta_path.read_text())
+            assert stored == meta, "Spaces do NOT MATCH the stored trajectory."
+        else:
+            meta_path.write_text(json.dumps(meta, indent=4))
+
+        self.meta = meta
+        self.grid_dtype = np.dtype(meta["grid_dtype"])
+
+        # Continue after the stored rows
+        reader = TrajectoryReader(self.path)
+        self._rows = len(reader)
+        self._episode = int(reader.steps["episode"][-1]) if len(reader) else -1
+        self._keyframes = len(reader.keyframes)
+        self._diffs = len(reader.diff_indices)
+        del reader
+
+        self._files = {name: open(self.path / f"{name}.bin", "ab") for name in FILES}
+
+        # Grid of the last row, diffs are taken against it
+        self._previous = np.empty(grid_space.shape, dtype=self.grid_dtype)
+        self._step = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for file in self._files.values():
+            file.close()
+
+    def reset(self, obs):
+        """Starts a new episode."""
+        self._episode += 1
+        self._step = 0
+
+        self._write(obs, None, 0.0, False, keyframe=True)
+
+    def step(
+        self,
+        obs,
+        action,
+        reward: float = 0.0,
+        terminated: bool = False,
+        diff: Optional[Tuple[np.ndarray, ...]] = None,
+    ):
+        """
+        Appends an observation.
+
+        `diff` are the cells changed since the previous observation,
+        as reported by the MDP `(flat indices, old values, new values)`.
+        Without it, the changed cells are found by comparing whole grids.
+        """
+        assert self._step is not None, "Call reset before step."
+
+        self._step += 1
+
+        keyframe = self._step % self.meta["keyframe_every"] == 0
+        self._write(obs, action, reward, terminated, keyframe, diff)
+
+    def _write(self, obs, action, reward, terminated, keyframe, diff=None):
+        grid, context = obs
+        grid = np.asarray(grid, dtype=self.grid_dtype)
+        previous = self._previous.reshape(-1)
+
+        if keyframe:
+            self._files["keyframes"].write(grid.tobytes())
+
+            self._keyframes += 1
+            self._base = self._diffs
+
+            np.copyto(self._previous, grid)
+
+        else:
+            if diff is None:
+                (indices,) = np.nonzero(grid.ravel() != previous)
+            else:
+                # A cell may change several times on a step
+                indices = np.unique(diff[0])
+
+            values = grid.ravel()[indices]
+
+            self._files["diff_indices"].write(indices.astype(TYPE_INDEX).tobytes())
+            self._files["diff_values"].write(values.tobytes())
+
+            self._diffs += len(indices)
+
+            previous[indices] = values
+
+        step = np.zeros(1, dtype=STEP)
+        step[0] = (
+            self._episode,
+            self._step,
+            self._keyframes - 1,
+            self._base,
+            self._diffs,
+            reward,
+            terminated,
+        )
+        self._files["steps"].write(step.tobytes())
+
+        flat_context = [np.asarray(part, dtype=TYPE_FLAT).ravel() for part in context]
+        self._files["contexts"].write(np.concatenate(flat_context).tobytes())
+
+        flat_action = np.zeros(self.meta["action_size"], dtype=TYPE_FLAT)
+        if action is not None:
+            flat_action[:] = np.ravel(action)
+        self._files["actions"].write(flat_action.tobytes())
+
+        self._rows += 1
+
+
+class TrajectoryReader:
+    """
+    Memory-mapped reads of a trajectory folder.
+
+    Rows are observations, in writing order.
+    Only the accessed keyframes and diffs are read from disk.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.meta = meta = json.loads((self.path / "meta.json").read_text())
+
+        self.grid_shape = tuple(meta["grid_shape"])
+        self.grid_dtype = np.dtype(meta["grid_dtype"])
+
+        self.context_shapes = [tuple(shape) for shape in meta["context_shapes"]]
+        self.context_dtypes = [np.dtype(dtype) for dtype in meta["context_dtypes"]]
+        context_size = sum(int(np.prod(shape)) for shape in self.context_shapes)
+
+        self.steps = self._memmap("steps", STEP)
+        self.keyframes = self._memmap("keyframes", self.grid_dtype, self.grid_shape)
+        self.diff_indices = self._memmap("diff_indices", TYPE_INDEX)
+        self.diff_values = self._memmap("diff_values", self.grid_dtype)
+        self.contexts = self._memmap("contexts", TYPE_FLAT, (context_size,))
+        self.actions = self._memmap("actions", TYPE_FLAT, (meta["action_size"],))
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __getitem__(self, row: int):
+        return self.grid(row), self.context(row)
+
+    @property
+    def rewards(self) -> np.ndarray:
+        return self.steps["reward"]
+
+    @property
+    def terminations(self) -> np.ndarray:
+        return self.steps["terminated"]
+
+    def episode_rows(self, episode: int) -> range:
+        """Rows of an episode, they are contiguous."""
+        episodes = self.steps["episode"]
+
+        start = np.searchsorted(episodes, episode, side="left")
+        stop = np.searchsorted(episodes, episode, side="right")
+
+        return range(int(start), int(stop))
+
+    def grid(self, row: int) -> np.ndarray:
+        """Materializes the grid of a row from its keyframe."""
+        step = self.steps[row]
+
+        grid = np.array(self.keyframes[step["keyframe"]])
+        self._apply(grid, step["base"], step["diff_stop"])
+
+        return grid
+
+    def grids(self, rows: range) -> np.ndarray:
+        """
+        Grids of consecutive rows, e.g. `episode_rows`, shape (len(rows), *grid_shape).
+        Each diff is applied once, from the keyframe of the first row.
+        """
+        grids = np.empty((len(rows), *self.grid_shape), dtype=self.grid_dtype)
+
+        for i, row in enumerate(rows):
+            step = self.steps[row]
+
+            if i == 0 or step["keyframe"] != self.steps[row - 1]["keyframe"]:
+                grids[i] = self.keyframes[step["keyframe"]]
+                self._apply(grids[i], step["base"], step["diff_stop"])
+            else:
+                grids[i] = grids[i - 1]
+                self._apply(
+                    grids[i], self.steps[row - 1]["diff_stop"], step["diff_stop"]
+                )
+
+        return grids
+
+    def context(self, row: int) -> tuple:
+        parts = []
+        offset = 0
+
+        for shape, dtype in zip(self.context_shapes, self.context_dtypes):
+            size = int(np.prod(shape))
+            part = self.contexts[row, offset : offset + size]
+
+            parts.append(part.reshape(shape).astype(dtype))
+            offset += size
+
+        return tuple(parts)
+
+    def _apply(self, grid, start, stop):
+        """Applies the diffs on [start, stop) in place, the last write wins."""
+        if start == stop:
+            return
+
+        indices = self.diff_indices[start:stop][::-1]
+        values = self.diff_values[start:stop][::-1]
+
+        indices, last = np.unique(indices, return_index=True)
+        grid.ravel()[indices] = values[last]
+
+    def _memmap(self, name, dtype, shape=()):
+        path = self.path / f"{name}.bin"
+        itemsize = np.dtype(dtype).itemsize * int(np.prod(shape, dtype=int))
+
+        nrows = path.stat().st_size // itemsize if path.exists() else 0
+
+        if nrows == 0:
+            return np.empty((0, *shape), dtype=dtype)
+
+        return np.memmap(path, dtype=dtype, mode="r", shape=(nrows, *shape))